@@ -1,3 +1,4 @@
+import threading
 import time
 from datetime import datetime, timedelta
 from logging_config import get_logger
@@ -5,24 +6,49 @@ from logging_config import get_logger
 # Initialize logger
 logger = get_logger(__name__)
 
+# Shared wake event: setting it (e.g. from a signal handler) aborts every
+# in-progress dwell at once instead of waiting out their sleeps.
+_wake = threading.Event()
+
+# Hand the final stretch to a tight re-check loop: a single long wait can
+# overshoot the deadline by a scheduler tick, which matters when the dwell
+# ends exactly at registration time.
+_FINAL_SPIN_S = 0.05
+
+def wake_all_dwellers():
+    """Aborts every in-progress and future dwell_until immediately."""
+    _wake.set()
+
 def dwell_until(nominal_time, offset_minutes=0, offset_seconds=0):
     """
     Calculates the target time by subtracting the offset (in minutes and seconds) from the nominal time,
     and dwells until that target time.
-    
+
     :param nominal_time: The nominal time as a datetime object.
     :param offset_minutes: The offset in minutes as an float.
     :param offset_seconds: The offset in seconds as an float.
+    :return: True if the target time was reached, False if the dwell was aborted.
     """
     target_time = nominal_time - timedelta(minutes=offset_minutes, seconds=offset_seconds)
-    current_time = datetime.now()
-    logger.info(f"Dwelling until {target_time} (current time: {current_time})")
+    logger.info(f"Dwelling until {target_time} (current time: {datetime.now()})")
+
+    deadline = target_time.timestamp()
+
+    # One interruptible wait covers all but the last few milliseconds; N
+    # concurrent dwellers cost one wakeup each instead of one per tick.
+    remaining = deadline - time.time()
+    if remaining > _FINAL_SPIN_S:
+        if _wake.wait(remaining - _FINAL_SPIN_S):
+            logger.info("Dwell aborted before the target time.")
+            return False
 
-    while current_time < target_time:
-        time_to_wait = (target_time - current_time).total_seconds()
-        time.sleep(min(time_to_wait, 1))  # Sleep in 1-second intervals to allow for quick checks
-        current_time = datetime.now()
+    while (remaining := deadline - time.time()) > 0:
+        if _wake.is_set():
+            logger.info("Dwell aborted before the target time.")
+            return False
+        time.sleep(min(remaining, 0.01))
     logger.info("Reached the target time.")
+    return True
 
 def is_within_offset(target_time, offset_minutes=0, offset_seconds=0):
     """
@@ -33,10 +59,13 @@ def is_within_offset(target_time, offset_minutes=0, offset_seconds=0):
     :param offset_seconds: The offset in seconds as a float.
     :return: True if within the offset, False otherwise.
     """
-    current_time = datetime.now()
-    offset = timedelta(minutes=offset_minutes, seconds=offset_seconds)
-    within_offset = target_time - offset <= current_time <= target_time
-    logger.info(f"Checking if within offset: {within_offset} (current time: {current_time}, target time: {target_time})")
+    # Plain float-second arithmetic; avoids timedelta construction and
+    # datetime comparisons for callers that poll this in a loop.
+    now_ts = time.time()
+    target_ts = target_time.timestamp()
+    offset_s = offset_minutes * 60 + offset_seconds
+    within_offset = target_ts - offset_s <= now_ts <= target_ts
+    logger.info(f"Checking if within offset: {within_offset} (current time: {datetime.now()}, target time: {target_time})")
     return within_offset
 
 # Example usage:
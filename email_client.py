@@ -1,14 +1,21 @@
 import os
 import os.path
+import functools
 import glob
 import base64
+import itertools
 import re
 import json
 import sys
+import threading
+import time
+from datetime import datetime
 from types import SimpleNamespace
 from email.message import EmailMessage
-import email
+from email.policy import SMTP as SMTP_POLICY
 
+import google_auth_httplib2
+import httplib2
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
@@ -18,21 +25,44 @@ from google.auth.exceptions import RefreshError
 
 from logging_config import get_logger
 
-EMAIL_CAPTURE_PATTERN = re.compile(r"^(.*?)?(?:<(.+@.+)>)?$")
+# Bare email addresses inside a header value, e.g. "Name <a@b.com>" -> a@b.com
+_ADDR_RE = re.compile(r'[\w\.\+-]+@[\w\.-]+\b')
+
+# Headers whose values are parsed into address lists on every message.
+_ADDR_HEADERS = ("To", "From", "Cc")
 
 # Initialize logger
 logger = get_logger(__name__)
 logger.setLevel("DEBUG")  # Set logger to debug level for detailed output
 
+# Gmail batch requests accept at most 100 operations per HTTP round trip.
+_BATCH_SIZE = 100
+
+# messages.batchModify accepts up to 1000 ids per call.
+_MODIFY_BATCH_SIZE = 1000
+
+# How long the cached contacts set stays fresh before it is refetched.
+_CONTACTS_CACHE_TTL = 300  # seconds
+
+# Refresh the access token proactively when this close to expiry, so a
+# request doesn't fail mid-flight on a token that just lapsed.
+_TOKEN_REFRESH_SLACK = 60  # seconds
+
 class EmailClient:
+    # Serializes token refreshes so concurrent callers don't refresh twice.
+    _creds_lock = threading.Lock()
+
     def __init__(self):
         logger.info("Initializing EmailClient...")
         self.creds = None
         self.webmaster = None
-        # Load optional webmaster config before authenticating
+        self._contacts_cache = None
+        self._contacts_cache_ts = 0.0
+        self._reply_queue = []
+        # Load optional webmaster config; authentication is deferred to the
+        # first API call so constructing a client never blocks on the
+        # interactive OAuth flow.
         self._load_webmaster_config()
-        self.authenticate_email()
-        self.whoami()
 
     def authenticate_email(self, token_file="email_token.json"):
         """Shows basic usage of the Gmail API. Lists the user's Gmail labels."""
@@ -75,47 +105,172 @@ class EmailClient:
                     "credentials.json", SCOPES
                 )
                 self.creds = flow.run_local_server(port=0)
-            with open(token_file, "w") as token:
-                token.write(self.creds.to_json())
-                logger.debug(f"Credentials saved to {token_file}.")
+            self._save_token(token_file)
+            # Credentials changed; rebuild cached API clients on next use.
+            self._invalidate_services()
+
+    def _save_token(self, token_file="email_token.json"):
+        """Persists credentials atomically, and only when they changed."""
+        new_json = self.creds.to_json()
+        if new_json == getattr(self, "_last_token_json", None):
+            logger.debug("Token unchanged; skipping write.")
+            return
+        tmp_file = token_file + ".tmp"
+        with open(tmp_file, "w") as token:
+            token.write(new_json)
+        os.replace(tmp_file, token_file)
+        self._last_token_json = new_json
+        logger.debug(f"Credentials saved to {token_file}.")
+
+    def _ensure_creds(self, token_file="email_token.json"):
+        """Makes sure the access token is valid before an API call.
+
+        Refreshes in-process (and re-persists the token) only when the
+        token is missing, expired, or within the refresh slack of expiry,
+        so back-to-back API calls never pay a redundant refresh RPC.
+        """
+        with self._creds_lock:
+            creds = self.creds
+            if creds is None:
+                self.authenticate_email(token_file)
+                return
+
+            expiry = getattr(creds, "expiry", None)
+            if getattr(creds, "valid", True) and (
+                expiry is None
+                or (expiry - datetime.utcnow()).total_seconds() > _TOKEN_REFRESH_SLACK
+            ):
+                return
+
+            if getattr(creds, "refresh_token", None):
+                try:
+                    logger.info("Refreshing expired credentials...")
+                    creds.refresh(Request())
+                    self._save_token(token_file)
+                    self._invalidate_services()
+                    return
+                except RefreshError:
+                    logger.warning(
+                        "Failed to refresh credentials. Reauthenticating..."
+                    )
+            self.authenticate_email(token_file)
+
+    @functools.cached_property
+    def _authorized_http(self):
+        """Shared authorized transport so calls reuse one TLS connection.
+
+        httplib2 is not thread-safe; this client is only ever used from a
+        single thread, so one transport per EmailClient is safe here.
+        """
+        return google_auth_httplib2.AuthorizedHttp(self.creds, http=httplib2.Http())
+
+    @functools.cached_property
+    def gmail_service(self):
+        """Gmail API client, built once and reused across calls."""
+        self._ensure_creds()
+        return build("gmail", "v1", http=self._authorized_http, cache_discovery=False)
+
+    @functools.cached_property
+    def people_service(self):
+        """People API client, built once and reused across calls."""
+        self._ensure_creds()
+        return build("people", "v1", http=self._authorized_http, cache_discovery=False)
+
+    def _invalidate_services(self):
+        """Drops cached API clients so they are rebuilt with current creds."""
+        self.__dict__.pop("gmail_service", None)
+        self.__dict__.pop("people_service", None)
+        self.__dict__.pop("_authorized_http", None)
+
+    @functools.cached_property
+    def user(self):
+        """Email address of the authenticated user, fetched on first use."""
+        logger.info("Fetching authenticated user's email address...")
+        service = self.gmail_service
+        user = service.users().getProfile(userId='me').execute().get('emailAddress')
+        logger.info(f"Authenticated as {user}")
+        return user
 
     def whoami(self):
         """Returns the email address of the authenticated user."""
-        logger.info("Fetching authenticated user's email address...")
-        service = build('gmail', 'v1', credentials=self.creds, cache_discovery=False)
-        self.user = service.users().getProfile(userId='me').execute().get('emailAddress')
-        logger.info(f"Authenticated as {self.user}")
-        logger.debug(f"Authenticated user email: {self.user}")
-
-    def is_sender_authorized(self, sender_email, auth_label="Scheduler"):
-        """Checks if the sender is a contact with the label 'Scheduler'."""
-        logger.info(f"Checking if sender {sender_email} is authorized...")
-        logger.debug(f"Sender email: {sender_email}")
-        if not self.creds:
-            self.authenticate_email()
+        return self.user
 
-        if isinstance(sender_email, list):
-            assert len(sender_email) == 1, "Only one sender email is allowed."
-            sender_email = sender_email[0]
+    def _load_authorized_contacts(self):
+        """Fetches all contact email addresses as a lowercased frozenset."""
+        service = self.people_service
+        addresses = set()
+        page_token = None
 
-        try:
-            service = build("people", "v1", credentials=self.creds, cache_discovery=False)
+        while True:
             results = (
                 service.people()
                 .connections()
-                .list(resourceName="people/me", personFields="emailAddresses,metadata")
+                .list(
+                    resourceName="people/me",
+                    personFields="emailAddresses,metadata",
+                    pageSize=1000,  # API max; fewer hops for large contact lists
+                    pageToken=page_token,
+                )
                 .execute()
             )
-            connections = results.get("connections", [])
-
-            for person in connections:
-                email_addresses = person.get("emailAddresses", [])
-                for email_object in email_addresses:
-                    email = email_object.get("value", "")
-                    if email.lower() == sender_email.lower():
-                        logger.info(f"Sender {sender_email} is authorized.")
-                        return True
-            logger.info(f"Sender {sender_email} is not authorized.")
+            for person in results.get("connections", []):
+                for email_object in person.get("emailAddresses", []):
+                    value = email_object.get("value", "")
+                    if value:
+                        addresses.add(value.lower())
+            page_token = results.get("nextPageToken")
+            if not page_token:
+                break
+
+        return frozenset(addresses)
+
+    def _authorized_contacts(self):
+        """Returns the contacts set, refetching it only when the TTL lapses."""
+        if (
+            self._contacts_cache is None
+            or time.monotonic() - self._contacts_cache_ts > _CONTACTS_CACHE_TTL
+        ):
+            self._contacts_cache = self._load_authorized_contacts()
+            self._contacts_cache_ts = time.monotonic()
+        return self._contacts_cache
+
+    def prefetch_contacts(self):
+        """Warms the authorized-contacts cache ahead of threaded use.
+
+        Callers that fan fetch work out to another thread load the
+        contacts here first, so later is_sender_authorized checks never
+        hit the (non-thread-safe) service mid-stream. Returns the
+        contacts snapshot (or None on failure) so a caller can pin it
+        for a whole pass via is_sender_authorized(contacts=...).
+        """
+        try:
+            return self._authorized_contacts()
+        except HttpError as error:
+            logger.info(f"Contacts prefetch failed: {error}")
+            return None
+
+    def is_sender_authorized(self, sender_email, auth_label="Scheduler", contacts=None):
+        """Checks if the sender is a contact with the label 'Scheduler'.
+
+        contacts, when given, is a pinned snapshot from
+        prefetch_contacts(); the check runs against it without touching
+        the TTL cache, so a lapse mid-pass can't trigger a refetch on
+        the shared transport.
+        """
+        logger.debug("Checking if sender %s is authorized...", sender_email)
+        if isinstance(sender_email, list):
+            assert len(sender_email) == 1, "Only one sender email is allowed."
+            sender_email = sender_email[0]
+
+        try:
+            # Cache refetches are TTL-gated; every check in between is a
+            # hash lookup instead of an API call.
+            if contacts is None:
+                contacts = self._authorized_contacts()
+            if sender_email.lower() in contacts:
+                logger.info("Sender %s is authorized.", sender_email)
+                return True
+            logger.info("Sender %s is not authorized.", sender_email)
             return False
 
         except HttpError as error:
@@ -123,14 +278,28 @@ class EmailClient:
             return False
 
     def read_new_emails(self, raw_email=False):
-        """Reads new unread emails from the user's Gmail inbox."""
+        """Reads new unread emails into a list.
+
+        Thin wrapper over iter_new_emails() for callers that need the
+        whole batch (or an emptiness check) up front.
+        """
+        msgs = list(self.iter_new_emails(raw_email=raw_email))
+        logger.info("Found %d new emails.", len(msgs))
+        logger.debug("Email details: %s", msgs)
+        return msgs
+
+    def iter_new_emails(self, raw_email=False):
+        """Streams new unread emails from the user's Gmail inbox.
+
+        Messages are fetched in batches of 100 and yielded one batch at a
+        time, so a consumer can start working on the first hundred while
+        later chunks are still on the wire, and the no-new-mail case
+        allocates nothing.
+        """
         logger.info("Reading new unread emails...")
         logger.debug(f"Raw email flag: {raw_email}")
-        if not self.creds:
-            self.authenticate_email()
-
         try:
-            service = build("gmail", "v1", credentials=self.creds, cache_discovery=False)
+            service = self.gmail_service
             results = (
                 service.users()
                 .messages()
@@ -142,160 +311,301 @@ class EmailClient:
             if not messages:
                 logger.info("No new emails found.")
                 return
-           
-            msgs = []
 
-            for message in messages:
-                msg = (
-                    service.users()
-                    .messages()
-                    .get(userId="me", id=message["id"], format="raw")
-                    .execute()
-                )
+            # Cheap metadata pass first, so full raw bodies are only
+            # downloaded for messages from known contacts.
+            messages = self._filter_authorized_messages(service, messages)
+
+            if not messages:
+                logger.info("No new emails from authorized senders.")
+                return
 
+            chunk_msgs = []
+
+            def handle_message(request_id, msg, exception):
+                if exception is not None:
+                    # A bad id shouldn't kill the rest of the batch.
+                    logger.warning(
+                        "Failed to fetch message %s: %s", request_id, exception
+                    )
+                    return
                 if raw_email:
-                    msgs.append(msg)
-                    continue
-
-                msg_str = base64.urlsafe_b64decode(msg["raw"]).decode("utf-8")
-                email_message = email.message_from_string(msg_str)
-
-                subject = email_message["Subject"]
-                message_id = email_message["Message-ID"]
-
-                address_fields = {
-                    field: self.extract_email_address(
-                        email_message.get(field, "")
-                    ) for field in ["To", "From", "Cc"]
-                }
-                
-                body = ""
-                if email_message.is_multipart():
-                    for part in email_message.walk():
-                        if part.get_content_type() == "text/plain":
-                            body = part.get_payload(decode=True).decode("utf-8")
-                            break
+                    chunk_msgs.append(msg)
                 else:
-                    body = email_message.get_payload(decode=True).decode("utf-8")
-
-                id = msg["id"]
-                thread_id = msg["threadId"]
-
-                msg_namespace = SimpleNamespace(
-                    **address_fields,
-                    subject=subject,
-                    body=body,
-                    id=id,
-                    thread_id=thread_id,
-                    message_id=message_id,
-                )
-                msgs.append(msg_namespace)
-
-            logger.info(f"Found {len(msgs)} new emails.")
-            logger.debug(f"Email details: {msgs}")
-            return msgs
+                    chunk_msgs.append(self._parse_full_msg(msg))
+
+            # Full format returns structured JSON with only the parts we
+            # read (headers + text body) instead of the entire RFC822
+            # payload, so attachment-heavy mail stays on the server.
+            msg_format = "raw" if raw_email else "full"
+
+            # Batch the per-message gets so N messages cost ceil(N/100)
+            # round trips instead of N.
+            message_iter = iter(messages)
+            while chunk := list(itertools.islice(message_iter, _BATCH_SIZE)):
+                batch = service.new_batch_http_request(callback=handle_message)
+                for message in chunk:
+                    batch.add(
+                        service.users()
+                        .messages()
+                        .get(userId="me", id=message["id"], format=msg_format),
+                        request_id=message["id"],
+                    )
+                batch.execute()
+                yield from chunk_msgs
+                chunk_msgs.clear()
 
         except HttpError as error:
             logger.info(f"An error occurred: {error}")
 
+    @staticmethod
+    def _extract_headers(msg):
+        """Maps a metadata-format message's headers to a name -> value dict."""
+        headers = msg.get("payload", {}).get("headers", [])
+        return {h["name"]: h["value"] for h in headers}
+
+    def _filter_authorized_messages(self, service, messages):
+        """Keeps only messages whose From address is a known contact.
+
+        Fetches just the From header (format="metadata") in batches, so
+        unauthorized mail never costs a full raw download. If the contact
+        list can't be loaded, all messages are kept and the caller's own
+        authorization checks still apply.
+        """
+        try:
+            contacts = self._authorized_contacts()
+        except HttpError as error:
+            logger.warning(f"Could not load contacts for pre-filtering: {error}")
+            return messages
+
+        authorized_ids = set()
+        failed_ids = set()
+
+        def handle_metadata(request_id, msg, exception):
+            if exception is not None:
+                logger.warning(
+                    "Failed to fetch metadata for %s: %s", request_id, exception
+                )
+                failed_ids.add(request_id)
+                return
+            hdr = self._extract_headers(msg)
+            senders = self.extract_email_address(hdr.get("From", ""))
+            if any(sender.lower() in contacts for sender in senders):
+                authorized_ids.add(msg["id"])
+
+        message_iter = iter(messages)
+        while chunk := list(itertools.islice(message_iter, _BATCH_SIZE)):
+            batch = service.new_batch_http_request(callback=handle_metadata)
+            for message in chunk:
+                batch.add(
+                    service.users()
+                    .messages()
+                    .get(
+                        userId="me",
+                        id=message["id"],
+                        format="metadata",
+                        metadataHeaders=["From"],
+                    ),
+                    request_id=message["id"],
+                )
+            batch.execute()
+
+        # Unauthorized mail used to be archived after the main loop saw
+        # it; now that it never reaches the caller, clean it up here or
+        # it stays unread and gets re-listed (and re-fetched) forever.
+        # Messages whose metadata fetch failed are left untouched so a
+        # transient error doesn't archive mail unseen.
+        skipped_ids = [
+            m["id"]
+            for m in messages
+            if m["id"] not in authorized_ids and m["id"] not in failed_ids
+        ]
+        if skipped_ids:
+            logger.info(
+                "Archiving %d unread message(s) from unknown senders.",
+                len(skipped_ids),
+            )
+            self._modify_ids(
+                skipped_ids, {"removeLabelIds": ["UNREAD", "INBOX"]}, "archived"
+            )
+        return [m for m in messages if m["id"] in authorized_ids]
+
+    @staticmethod
+    def _find_body_part(payload, mime_type="text/plain"):
+        """Finds the first part of the given MIME type with inline data."""
+        if payload.get("mimeType") == mime_type and payload.get("body", {}).get("data"):
+            return payload
+        for part in payload.get("parts", []):
+            found = EmailClient._find_body_part(part, mime_type)
+            if found:
+                return found
+        return None
+
+    def _parse_full_msg(self, msg):
+        """Parses a full-format Gmail message into a SimpleNamespace.
+
+        Full format is structured JSON, so headers and the text body are
+        read directly without re-parsing RFC822 bytes, and attachment
+        data never leaves the server.
+        """
+        hdr = self._extract_headers(msg)
+
+        get = hdr.get
+        extract = _ADDR_RE.findall
+        address_fields = {
+            field: extract(get(field, "")) for field in _ADDR_HEADERS
+        }
+
+        payload = msg.get("payload", {})
+        part = (
+            self._find_body_part(payload)
+            or self._find_body_part(payload, "text/html")
+        )
+        body = ""
+        if part is not None:
+            body = base64.urlsafe_b64decode(part["body"]["data"]).decode(
+                "utf-8", errors="replace"
+            )
+
+        return SimpleNamespace(
+            **address_fields,
+            subject=get("Subject"),
+            body=body,
+            id=msg["id"],
+            thread_id=msg["threadId"],
+            message_id=get("Message-ID") or get("Message-Id"),
+        )
+
     def mark_email_as_read(self, email):
         """Marks an email as read."""
-        logger.info(f"Marking email with ID {email.id} as read...")
-        logger.debug(f"Email ID: {email.id}")
-        if not self.creds:
-            self.authenticate_email()
-
+        logger.debug("Marking email with ID %s as read...", email.id)
         try:
-            service = build("gmail", "v1", credentials=self.creds, cache_discovery=False)
+            service = self.gmail_service
             service.users().messages().modify(
                 userId="me", id=email.id, body={"removeLabelIds": ["UNREAD"]}
             ).execute()
-            logger.info(f"Email with ID {email.id} marked as read.")
+            logger.info("Email with ID %s marked as read.", email.id)
 
         except HttpError as error:
             logger.info(f"An error occurred: {error}")
 
     def archive_email(self, email):
         """Archives an email."""
-        logger.info(f"Archiving email with ID {email.id}...")
-        logger.debug(f"Email ID: {email.id}")
-        if not self.creds:
-            self.authenticate_email()
-
+        logger.debug("Archiving email with ID %s...", email.id)
         try:
-            service = build("gmail", "v1", credentials=self.creds, cache_discovery=False)
+            service = self.gmail_service
             service.users().messages().modify(
                 userId="me", id=email.id, body={"removeLabelIds": ["INBOX"]}
             ).execute()
-            logger.info(f"Email with ID {email.id} archived.")
+            logger.info("Email with ID %s archived.", email.id)
 
         except HttpError as error:
             logger.info(f"An error occurred: {error}")
 
-    def delete_email(self, email):
-        """Deletes an email."""
-        logger.info(f"Deleting email with ID {email.id}...")
-        logger.debug(f"Email ID: {email.id}")
-        if not self.creds:
-            self.authenticate_email()
-
+    def _modify_ids(self, ids, body, verb):
+        """Applies one label change to many message ids via batchModify."""
+        if not ids:
+            return
         try:
-            service = build("gmail", "v1", credentials=self.creds, cache_discovery=False)
-            service.users().messages().delete(userId="me", id=email.id).execute()
-            logger.info(f"Email with ID {email.id} deleted.")
-
+            service = self.gmail_service
+            id_iter = iter(ids)
+            while chunk := list(itertools.islice(id_iter, _MODIFY_BATCH_SIZE)):
+                service.users().messages().batchModify(
+                    userId="me", body={"ids": chunk, **body}
+                ).execute()
+            logger.info("%d email(s) %s.", len(ids), verb)
         except HttpError as error:
             logger.info(f"An error occurred: {error}")
 
-    def reply_to_email(self, email, reply_plaintext, reply_html=None, subject=None, user_tag=None):
-        """Replies to an email."""
-        logger.info(f"Replying to email with ID {email.id}...")
-        logger.debug(f"Reply content: {reply_plaintext}")
-        if not self.creds:
-            self.authenticate_email()
+    def _batch_modify(self, emails, body, verb):
+        """Applies one label change to many emails via batchModify."""
+        self._modify_ids([message.id for message in emails], body, verb)
 
-        try:
-            service = build("gmail", "v1", credentials=self.creds, cache_discovery=False)
+    def mark_emails_as_read(self, emails):
+        """Marks many emails as read in one batchModify round trip."""
+        self._batch_modify(emails, {"removeLabelIds": ["UNREAD"]}, "marked as read")
 
-            message = EmailMessage()
-            message.set_content(reply_plaintext)
+    def archive_emails(self, emails):
+        """Archives many emails in one batchModify round trip."""
+        self._batch_modify(emails, {"removeLabelIds": ["INBOX"]}, "archived")
 
-            if reply_html:
-                message.add_alternative(reply_html, subtype="html")
-
-
-            me = self.user.lower()
-
-            # Use plus-tagged From address for user context
-            if user_tag and user_tag != "default":
-                local_part, domain = me.split('@', 1)
-                from_address = f"{local_part}+{user_tag}@{domain}"
-            else:
-                from_address = me
+    def delete_email(self, email):
+        """Deletes an email."""
+        logger.debug("Deleting email with ID %s...", email.id)
+        try:
+            service = self.gmail_service
+            service.users().messages().delete(userId="me", id=email.id).execute()
+            logger.info("Email with ID %s deleted.", email.id)
 
-            logger.debug(f"Replying to email as: {from_address}")
-
-            # Strip self and any plus-tagged variants from recipients
-            base_local = me.split('@')[0].split('+')[0]
-            base_domain = me.split('@')[1] if '@' in me else ''
-            message['To'] = ", ".join([
-                address for address in email.From
-                if not ('@' in address
-                        and address.split('@')[0].split('+')[0].lower() == base_local
-                        and address.split('@')[1].lower() == base_domain)
-            ])
-            message['From'] = from_address
-            # Exclude Cc to prevent exposing other users' plus-tagged addresses
-            # message['Cc'] omitted intentionally for multi-user privacy
-            message['Subject'] = subject or email.subject
-            message['References'] = email.message_id
-            message['In-Reply-To'] = email.message_id
+        except HttpError as error:
+            logger.info(f"An error occurred: {error}")
 
-            logger.debug(f"Message headers: {message.items()}")
+    def _build_reply(self, email, reply_plaintext, reply_html=None, subject=None, user_tag=None):
+        """Builds the Gmail send body for a reply without sending it."""
+        message = EmailMessage()
+        message.set_content(reply_plaintext)
+
+        if reply_html:
+            message.add_alternative(reply_html, subtype="html")
+
+        me = self.user.lower()
+
+        # Use plus-tagged From address for user context
+        if user_tag and user_tag != "default":
+            local_part, domain = me.split('@', 1)
+            from_address = f"{local_part}+{user_tag}@{domain}"
+        else:
+            from_address = me
+
+        logger.debug(f"Replying to email as: {from_address}")
+
+        # Strip self and any plus-tagged variants from recipients, and
+        # dedupe in the same pass so an address appearing twice in the
+        # header doesn't get the reply twice.
+        base_local = me.split('@')[0].split('+')[0]
+        base_domain = me.split('@')[1] if '@' in me else ''
+        seen = set()
+        recipients = []
+        for address in email.From:
+            key = address.lower()
+            if key in seen:
+                continue
+            seen.add(key)
+            if ('@' in address
+                    and address.split('@')[0].split('+')[0].lower() == base_local
+                    and address.split('@')[1].lower() == base_domain):
+                continue
+            recipients.append(address)
+        message['To'] = ", ".join(recipients)
+        message['From'] = from_address
+        # Exclude Cc to prevent exposing other users' plus-tagged addresses
+        # message['Cc'] omitted intentionally for multi-user privacy
+        message['Subject'] = subject or email.subject
+        message['References'] = email.message_id
+        message['In-Reply-To'] = email.message_id
+
+        logger.debug(f"Message headers: {message.items()}")
+
+        encoded_message = base64.urlsafe_b64encode(
+            message.as_bytes(policy=SMTP_POLICY)
+        ).decode("ascii")
+
+        return {"raw": encoded_message, "threadId": email.thread_id}
 
-            encoded_message = base64.urlsafe_b64encode(message.as_bytes()).decode()
+    def reply_to_email(self, email, reply_plaintext, reply_html=None, subject=None, user_tag=None):
+        """Replies to an email immediately.
 
-            create_message = {"raw": encoded_message, "threadId": email.thread_id}
+        Batch callers should prefer enqueue_reply() + flush_replies(),
+        which send all queued replies in one HTTP round trip.
+        """
+        logger.info("Replying to email with ID %s...", email.id)
+        logger.debug("Reply content: %s", reply_plaintext)
+        try:
+            service = self.gmail_service
+            create_message = self._build_reply(
+                email, reply_plaintext, reply_html=reply_html,
+                subject=subject, user_tag=user_tag,
+            )
 
             # pylint: disable=E1101
             send_message = (
@@ -310,14 +620,47 @@ class EmailClient:
         except HttpError as error:
             logger.info(f"An error occurred: {error}")
 
+    def enqueue_reply(self, email, reply_plaintext, reply_html=None, subject=None, user_tag=None):
+        """Builds a reply and queues it for the next flush_replies().
+
+        The message is fully rendered here; only the send round trip is
+        deferred, so a batch of N replies costs one HTTP request instead
+        of N.
+        """
+        logger.info("Queueing reply to email with ID %s...", email.id)
+        create_message = self._build_reply(
+            email, reply_plaintext, reply_html=reply_html,
+            subject=subject, user_tag=user_tag,
+        )
+        self._reply_queue.append((email.id, create_message))
+
+    def flush_replies(self):
+        """Sends all queued replies in batched HTTP requests."""
+        if not self._reply_queue:
+            return
+        logger.info("Sending %d queued reply(ies)...", len(self._reply_queue))
+        service = self.gmail_service
+
+        def handle_sent(request_id, response, exception):
+            if exception is not None:
+                logger.error(f"Failed to send queued reply {request_id}: {exception}")
+
+        queue_iter = iter(self._reply_queue)
+        while chunk := list(itertools.islice(queue_iter, _BATCH_SIZE)):
+            batch = service.new_batch_http_request(callback=handle_sent)
+            for email_id, create_message in chunk:
+                batch.add(
+                    service.users().messages().send(userId="me", body=create_message),
+                    request_id=email_id,
+                )
+            batch.execute()
+        self._reply_queue.clear()
+
     def send_notification(self, subject, body, user_tag=None):
         """Sends a notification email to the system's own inbox."""
         logger.info(f"Sending notification: {subject}")
-        if not self.creds:
-            self.authenticate_email()
-
         try:
-            service = build("gmail", "v1", credentials=self.creds, cache_discovery=False)
+            service = self.gmail_service
 
             me = self.user.lower()
             if user_tag and user_tag != "default":
@@ -348,7 +691,9 @@ class EmailClient:
             message['From'] = from_address
             message['Subject'] = subject
 
-            encoded_message = base64.urlsafe_b64encode(message.as_bytes()).decode()
+            encoded_message = base64.urlsafe_b64encode(
+                message.as_bytes(policy=SMTP_POLICY)
+            ).decode("ascii")
             create_message = {"raw": encoded_message}
 
             send_message = (
@@ -369,7 +714,9 @@ class EmailClient:
                     wm_message['From'] = from_address
                     wm_message['Subject'] = subject
 
-                    encoded_wm = base64.urlsafe_b64encode(wm_message.as_bytes()).decode()
+                    encoded_wm = base64.urlsafe_b64encode(
+                        wm_message.as_bytes(policy=SMTP_POLICY)
+                    ).decode("ascii")
                     create_wm = {"raw": encoded_wm}
 
                     service.users().messages().send(userId="me", body=create_wm).execute()
@@ -448,11 +795,28 @@ class EmailClient:
             # Flatten list of addresses
             result = []
             for email_str in emails:
-                result.extend(re.findall(r'[\w\.\+-]+@[\w\.-]+\b', email_str or ''))
+                result.extend(_ADDR_RE.findall(email_str or ''))
             return result
-        return re.findall(r'[\w\.\+-]+@[\w\.-]+\b', emails)
+        return _ADDR_RE.findall(emails)
         
 
+_shared_client = None
+
+
+def get_email_client():
+    """Returns a process-wide shared EmailClient, creating it on first use.
+
+    Construction reloads the webmaster config and authentication builds
+    API clients and an authorized transport, so repeat callers in one
+    process should reuse a single instance rather than paying that setup
+    per call.
+    """
+    global _shared_client
+    if _shared_client is None:
+        _shared_client = EmailClient()
+    return _shared_client
+
+
 # Example usage:
 # receiver = GmailEventReceiver()
 # new_emails = receiver.read_new_emails()
@@ -1,54 +1,130 @@
+import atexit
 import sqlite3
+import time
 from datetime import datetime, timedelta
 from logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Hot-path SQL hoisted to module level: sqlite3's compiled-statement cache
+# keys on the exact string object contents, so reusing one literal per
+# query avoids re-parsing and re-planning. One-shot migration SQL stays
+# inline where it runs.
+_SQL_INSERT = """
+    INSERT OR REPLACE INTO events (event_spec, user_tag, event_date, time_range, registration_time, additional_info)
+    VALUES (?, ?, ?, ?, ?, ?)
+"""
+
+_SQL_EVENTS_BY_DATE = """
+    SELECT event_date, time_range FROM events WHERE registration_time = ? AND user_tag = ?
+"""
+
+_SQL_NEXT_EVENTS = """
+    SELECT event_date, time_range, registration_time, user_tag FROM events
+    WHERE registration_time = (
+        SELECT MIN(registration_time) FROM events WHERE registration_time > ?
+    )
+    ORDER BY user_tag ASC
+"""
+
+_SQL_DELETE_EVENT = """
+    DELETE FROM events WHERE event_spec = ? AND user_tag = ?
+"""
+
+_SQL_DELETE_AT = """
+    DELETE FROM events WHERE registration_time = ? AND user_tag = ?
+"""
+
+_SQL_DELETE_OLD = """
+    DELETE FROM events WHERE registration_time < ?
+"""
+
+# Bumped whenever the schema changes; stored in PRAGMA user_version so
+# startup can skip the sqlite_master/table_info probes on an up-to-date
+# database.
+_SCHEMA_VERSION = 1
+
+_SQL_LIST_FOR_USER = """
+    SELECT event_date, time_range, registration_time, additional_info, user_tag FROM events
+    WHERE user_tag = ?
+    ORDER BY registration_time DESC
+"""
+
+# How long a list_all_events result stays fresh. Report traffic is far
+# more frequent than event writes, and writes through this class
+# invalidate the entry immediately, so staleness only applies to edits
+# made outside the process.
+_LIST_CACHE_TTL_S = 60
+
+
+def _to_epoch(registration_time):
+    """Normalizes a registration time to integer Unix epoch seconds.
+
+    Accepts a datetime, an epoch number, or the legacy
+    "%Y-%m-%d %H:%M:%S" string format.
+    """
+    if isinstance(registration_time, datetime):
+        return int(registration_time.timestamp())
+    if isinstance(registration_time, (int, float)):
+        return int(registration_time)
+    return int(datetime.strptime(registration_time, "%Y-%m-%d %H:%M:%S").timestamp())
+
+
 class Events:
     def __init__(self, db_name="events.db"):
-        self.conn = sqlite3.connect(db_name)
+        self.conn = sqlite3.connect(db_name, cached_statements=256)
+        # Set by get_events() for process-wide shared instances; close()
+        # keeps those connections open until process exit.
+        self._shared = False
+        # user_tag -> (monotonic timestamp, rows) for list_all_events.
+        self._list_cache = {}
+        self._configure_connection()
         self.cursor = self.conn.cursor()
         self._create_table()
 
+    def _configure_connection(self):
+        """Applies per-connection pragmas before any statements run."""
+        # WAL commits need far fewer fsyncs than the default DELETE journal
+        # and let readers proceed while a write is in flight. journal_mode
+        # persists in the database file; synchronous is per-connection.
+        journal_mode = self.conn.execute("PRAGMA journal_mode=WAL").fetchone()[0]
+        if journal_mode.lower() != "wal":
+            logger.warning(f"Could not enable WAL journal mode (got '{journal_mode}').")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        # Bound WAL file growth between checkpoints.
+        self.conn.execute("PRAGMA wal_autocheckpoint=1000")
+        # Keep reads memory-bound: a 64 MiB page cache, in-memory scratch
+        # space for ORDER BY, and a 256 MiB mmap window over the file.
+        self.conn.execute("PRAGMA cache_size=-65536")
+        self.conn.execute("PRAGMA temp_store=MEMORY")
+        self.conn.execute("PRAGMA mmap_size=268435456")
+
     def _create_table(self):
         """Create table if it doesn't exist, with migration support."""
+        # user_version is a 4-byte header field, so this read is the only
+        # schema check an up-to-date database pays per connection. The
+        # sqlite_master/table_info probes below only run the first time a
+        # database (or a pre-versioning one) is opened.
+        version = self.cursor.execute("PRAGMA user_version").fetchone()[0]
+        if version >= _SCHEMA_VERSION:
+            return
+
         # Check if table exists and needs migration
-        self.cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='events'")
-        table_exists = self.cursor.fetchone() is not None
+        self.cursor.execute("SELECT sql FROM sqlite_master WHERE type='table' AND name='events'")
+        row = self.cursor.fetchone()
+        table_exists = row is not None
 
         if table_exists:
+            create_sql = row[0] or ""
             self.cursor.execute("PRAGMA table_info(events)")
-            columns = [column[1] for column in self.cursor.fetchall()]
-            if "user_tag" not in columns:
-                logger.info("Migrating database to include user_tag column...")
-                try:
-                    self.cursor.execute("ALTER TABLE events RENAME TO events_old")
-                    self.cursor.execute(
-                        """
-                        CREATE TABLE events (
-                            event_spec TEXT NOT NULL,
-                            user_tag TEXT NOT NULL,
-                            event_date TEXT NOT NULL,
-                            time_range TEXT NOT NULL,
-                            registration_time TIMESTAMP NOT NULL,
-                            additional_info TEXT,
-                            PRIMARY KEY (event_spec, user_tag)
-                        )
-                    """
-                    )
-                    self.cursor.execute(
-                        """
-                        INSERT INTO events (event_spec, user_tag, event_date, time_range, registration_time, additional_info)
-                        SELECT event_spec, 'default', event_date, time_range, registration_time, additional_info FROM events_old
-                    """
-                    )
-                    self.cursor.execute("DROP TABLE events_old")
-                    self.conn.commit()
-                    logger.info("Migration complete.")
-                except Exception as e:
-                    self.conn.rollback()
-                    logger.error(f"Migration failed, rolled back: {e}", exc_info=True)
-                    raise
+            columns = {column[1]: column[2] for column in self.cursor.fetchall()}
+            needs_user_tag = "user_tag" not in columns
+            # Legacy schemas stored registration_time as TEXT timestamps.
+            needs_epoch = columns.get("registration_time", "").upper() != "INTEGER"
+            # Legacy schemas also kept a redundant hidden rowid B-tree.
+            needs_without_rowid = "WITHOUT ROWID" not in create_sql.upper()
+            if needs_user_tag or needs_epoch or needs_without_rowid:
+                self._migrate_table(needs_user_tag)
         else:
             self.cursor.execute(
                 """
@@ -57,37 +133,125 @@ class Events:
                     user_tag TEXT NOT NULL,
                     event_date TEXT NOT NULL,
                     time_range TEXT NOT NULL,
-                    registration_time TIMESTAMP NOT NULL,
+                    registration_time INTEGER NOT NULL,
                     additional_info TEXT,
                     PRIMARY KEY (event_spec, user_tag)
-                )
+                ) WITHOUT ROWID
             """
             )
 
+        self._create_indexes()
+        # PRAGMA doesn't accept bound parameters; the value is a trusted
+        # module constant.
+        self.cursor.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+        self.conn.commit()
+
+    def _migrate_table(self, needs_user_tag):
+        """Rebuilds the events table on the current schema.
+
+        Handles both legacy layouts: missing user_tag column and TEXT
+        registration_time values (converted to epoch seconds in Python so
+        naive local timestamps keep their meaning).
+        """
+        logger.info("Migrating events table to the current schema...")
+        try:
+            self.cursor.execute("ALTER TABLE events RENAME TO events_old")
+            self.cursor.execute(
+                """
+                CREATE TABLE events (
+                    event_spec TEXT NOT NULL,
+                    user_tag TEXT NOT NULL,
+                    event_date TEXT NOT NULL,
+                    time_range TEXT NOT NULL,
+                    registration_time INTEGER NOT NULL,
+                    additional_info TEXT,
+                    PRIMARY KEY (event_spec, user_tag)
+                ) WITHOUT ROWID
+            """
+            )
+            if needs_user_tag:
+                select_sql = """
+                    SELECT event_spec, 'default', event_date, time_range, registration_time, additional_info
+                    FROM events_old
+                """
+            else:
+                select_sql = """
+                    SELECT event_spec, user_tag, event_date, time_range, registration_time, additional_info
+                    FROM events_old
+                """
+            rows = self.cursor.execute(select_sql).fetchall()
+            self.cursor.executemany(
+                """
+                INSERT INTO events (event_spec, user_tag, event_date, time_range, registration_time, additional_info)
+                VALUES (?, ?, ?, ?, ?, ?)
+            """,
+                [
+                    (row[0], row[1], row[2], row[3], _to_epoch(row[4]), row[5])
+                    for row in rows
+                ],
+            )
+            self.cursor.execute("DROP TABLE events_old")
+            self.conn.commit()
+            logger.info("Migration complete.")
+        except Exception as e:
+            self.conn.rollback()
+            logger.error(f"Migration failed, rolled back: {e}", exc_info=True)
+            raise
+
+    def _create_indexes(self):
+        """Creates secondary indexes for the registration_time lookups."""
+        # Covering index: the MIN()/range probe in get_next_event_after and
+        # the equality+user_tag lookups are satisfied from the index alone
+        # instead of a full table scan plus temp sort.
+        self.cursor.execute(
+            """
+            CREATE INDEX IF NOT EXISTS idx_events_reg_time
+            ON events(registration_time, user_tag, event_date, time_range)
+            """
+        )
+        self.conn.commit()
+
     def create_spec(self, event_date, time_range):
         """Creates a unique event specification."""
         return f"{event_date} {time_range}"
     
+    def insert_events(self, rows):
+        """Upserts many events in a single transaction.
+
+        Each row is an (event_date, time_range, registration_time,
+        user_tag, additional_info) tuple. The caller owns the transaction
+        boundary (via the context manager or close()), so a batch costs a
+        single commit instead of one per row.
+        """
+        params = [
+            (
+                self.create_spec(event_date, time_range),
+                user_tag,
+                event_date,
+                time_range,
+                _to_epoch(registration_time),
+                additional_info,
+            )
+            for event_date, time_range, registration_time, user_tag, additional_info in rows
+        ]
+        self.cursor.executemany(_SQL_INSERT, params)
+        for _, user_tag, _, _, _, _ in params:
+            self._list_cache.pop(user_tag, None)
+        logger.debug(f"Upserted {len(params)} event(s).")
+
     def insert_event(self, event_date, time_range, registration_time, user_tag, additional_info=""):
-        self.cursor.execute(
-            """
-            INSERT OR REPLACE INTO events (event_spec, user_tag, event_date, time_range, registration_time, additional_info)
-            VALUES (?, ?, ?, ?, ?, ?)
-        """,
-            (self.create_spec(event_date, time_range), user_tag, event_date, time_range, registration_time, additional_info),
+        self.insert_events(
+            [(event_date, time_range, registration_time, user_tag, additional_info)]
         )
-        self.conn.commit()
         logger.info(f"Upserted event {event_date} {time_range} for user '{user_tag}'.")
 
     def get_events_by_date(self, registration_time, user_tag):
         self.cursor.execute(
-            """
-            SELECT event_date, time_range FROM events WHERE registration_time = ? AND user_tag = ?
-        """,
-            (registration_time, user_tag),
+            _SQL_EVENTS_BY_DATE,
+            (_to_epoch(registration_time), user_tag),
         )
-        rows = self.cursor.fetchall()
-        return [(row[0], row[1]) for row in rows]
+        # The query already selects exactly (event_date, time_range).
+        return self.cursor.fetchall()
 
     def get_next_event_after(self, timestamp=None):
 
@@ -95,36 +259,18 @@ class Events:
             timestamp = datetime.now()
 
         """Finds all events at the next registration time after the provided timestamp."""
-        # First, find the earliest registration time
+        # Single query: the MIN() subselect resolves against the
+        # registration_time index and the outer query index-scans the
+        # matching rows, instead of two separate round trips.
         self.cursor.execute(
-            """
-            SELECT MIN(registration_time) FROM events 
-            WHERE registration_time > ?
-        """,
-            (timestamp,),
+            _SQL_NEXT_EVENTS,
+            (_to_epoch(timestamp),),
         )
-        row = self.cursor.fetchone()
-        if not row or not row[0]:
-            return []
-        
-        next_registration_time = row[0]
-        
-        # Then, get all events at that time
-        self.cursor.execute(
-            """
-            SELECT event_date, time_range, registration_time, user_tag FROM events 
-            WHERE registration_time = ?
-            ORDER BY user_tag ASC
-        """,
-            (next_registration_time,),
-        )
-        rows = self.cursor.fetchall()
-        
         events = []
-        for row in rows:
+        for row in self.cursor:
             event_date = row[0]
             time_range = row[1]
-            registration_time = datetime.strptime(row[2], "%Y-%m-%d %H:%M:%S")
+            registration_time = datetime.fromtimestamp(row[2])
             user_tag = row[3]
             events.append({
                 "event_date": event_date,
@@ -142,24 +288,32 @@ class Events:
         logger.debug(f"Event spec to remove: {event_spec}")
         
         self.cursor.execute(
-            """
-            DELETE FROM events WHERE event_spec = ? AND user_tag = ?
-        """,
+            _SQL_DELETE_EVENT,
             (event_spec, user_tag),
         )
-        self.conn.commit()
+        self._list_cache.pop(user_tag, None)
+
+    def remove_events_at(self, registration_time, user_tag):
+        """Removes all of a user's events at one registration time.
+
+        One statement regardless of how many rows match, using the
+        registration_time index.
+        """
+        self.cursor.execute(
+            _SQL_DELETE_AT,
+            (_to_epoch(registration_time), user_tag),
+        )
+        self._list_cache.pop(user_tag, None)
 
     def remove_old_events(self, n_days):
         """Removes events with a registration_time older than n_days days ago."""
         cutoff = datetime.now() - timedelta(days=n_days)
-        cutoff_str = cutoff.strftime("%Y-%m-%d %H:%M:%S")
         self.cursor.execute(
-            """
-            DELETE FROM events WHERE registration_time < ?
-            """,
-            (cutoff_str,),
+            _SQL_DELETE_OLD,
+            (_to_epoch(cutoff),),
         )
-        self.conn.commit()
+        # Cutoff deletes can touch any user; drop everything.
+        self._list_cache.clear()
 
     def list_all_events(self, user_tag):
         """Returns all rows for a specific user, ordered by descending registration_time.
@@ -175,17 +329,77 @@ class Events:
         """
         if not user_tag:
             raise ValueError("user_tag is required to list events (cannot list across all users)")
-        
+
+        cached = self._list_cache.get(user_tag)
+        if cached is not None and time.monotonic() - cached[0] < _LIST_CACHE_TTL_S:
+            return cached[1]
+
         self.cursor.execute(
-            """
-            SELECT event_date, time_range, registration_time, additional_info, user_tag FROM events 
-            WHERE user_tag = ?
-            ORDER BY registration_time DESC
-            """,
+            _SQL_LIST_FOR_USER,
             (user_tag,)
         )
-        rows = self.cursor.fetchall()
+        # Iterate the cursor directly: one pass, no intermediate
+        # fetchall() list. registration_time comes back as a datetime
+        # again for display.
+        rows = [
+            (row[0], row[1], datetime.fromtimestamp(row[2]), row[3], row[4])
+            for row in self.cursor
+        ]
+        self._list_cache[user_tag] = (time.monotonic(), rows)
         return rows
 
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        # Delegate to the connection: commit the pending transaction on
+        # success, roll it back if the block raised.
+        return self.conn.__exit__(exc_type, exc_value, traceback)
+
     def close(self):
+        # Commit anything still pending so callers that never used the
+        # context manager don't lose writes.
+        self.conn.commit()
+        # Refresh planner statistics when they've gone stale; a no-op
+        # otherwise. Running it here covers both the per-cycle close of a
+        # shared instance and the final close at exit, keeping the
+        # registration_time index attractive to the planner as the table
+        # grows.
+        self.conn.execute("PRAGMA optimize")
+        if self._shared:
+            # Shared connections stay open for the next caller; the real
+            # close happens in _close_shared_instances at exit.
+            return
         self.conn.close()
+
+
+_shared_instances = {}
+
+
+def get_events(db_name="events.db"):
+    """Returns a process-wide shared Events instance for db_name.
+
+    Opening a connection re-runs the pragmas and schema checks, which
+    costs far more than the queries main.py issues per cycle, so callers
+    that connect repeatedly should go through here. close() on a shared
+    instance commits but leaves the connection open for the next caller.
+    """
+    instance = _shared_instances.get(db_name)
+    if instance is None:
+        instance = Events(db_name)
+        instance._shared = True
+        _shared_instances[db_name] = instance
+    return instance
+
+
+def _close_shared_instances():
+    for instance in _shared_instances.values():
+        instance._shared = False
+        try:
+            instance.close()
+        except sqlite3.Error as e:
+            logger.warning(f"Error closing shared events connection: {e}")
+    _shared_instances.clear()
+
+
+atexit.register(_close_shared_instances)
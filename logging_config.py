@@ -1,5 +1,5 @@
 import logging
-from datetime import datetime
+import logging.handlers
 import os
 
 current_directory = os.path.dirname(os.path.abspath(__file__))
@@ -8,16 +8,24 @@ os.chdir(current_directory)
 # Ensure the logs directory exists
 os.makedirs("logs", exist_ok=True)
 
-# Initialize logger
-log_date = datetime.now().strftime("%Y-%m-%d")
-log_file = f"logs/{log_date}.txt"
-logging.basicConfig(
-    filename=log_file,
-    filemode="a",  # Append to the log file instead of overwriting
-    format="%(asctime)s - %(name)s - %(lineno)d: %(message)s",
-    datefmt="%Y-%m-%d %H:%M:%S",
-    level=logging.INFO,
-)
+# Configure the root logger once with a handler that rotates at midnight,
+# so a run that crosses midnight moves to a new file instead of writing
+# to the date the process started on. Guarded on existing handlers so a
+# re-import never attaches a duplicate handler (basicConfig silently
+# no-ops after the first call, which hid exactly that kind of race).
+_root_logger = logging.getLogger()
+if not _root_logger.handlers:
+    _handler = logging.handlers.TimedRotatingFileHandler(
+        "logs/app.log", when="midnight", backupCount=30, encoding="utf-8"
+    )
+    _handler.setFormatter(
+        logging.Formatter(
+            "%(asctime)s - %(name)s - %(lineno)d: %(message)s",
+            datefmt="%Y-%m-%d %H:%M:%S",
+        )
+    )
+    _root_logger.addHandler(_handler)
+    _root_logger.setLevel(logging.INFO)
 
 def get_logger(name):
     """Returns a logger instance with the given name."""
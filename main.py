@@ -1,19 +1,33 @@
+import html
+
 import textile
 from tabulate import tabulate
 import json
-from events import Events
+from events import get_events
 from website import Website
 from dwell import dwell_until, is_within_offset
-from email_client import EmailClient
+from email_client import get_email_client
 from user_intent import extract_user_intent
-from user_config import extract_user_tag, validate_user_tag, is_sender_allowed
+from user_config import (
+    extract_user_tag,
+    validate_user_tag_fast,
+    list_known_user_tags,
+    is_sender_allowed,
+    get_website_token_file,
+)
 from logging_config import get_logger
 import os
+import queue
 import random
+import socket
+import ssl
 import threading
+from itertools import chain
+from urllib.parse import urlparse
 import concurrent.futures
 import traceback
 from datetime import datetime, timezone
+from types import SimpleNamespace
 import platform
 import sys
 
@@ -60,92 +74,146 @@ MAX_DELAY = APP_CONFIG["max_delay_seconds"]  # seconds
 cleanup_days = APP_CONFIG["cleanup_days"]  # days to keep events in the database
 
 
-def register_for_single_event(
-    event_info, headless=True, results=None, results_lock=None
-):
-    """Register for a single event (used for concurrent registrations)."""
+def register_for_single_event(event_info, headless=True, barrier=None):
+    """Register for a single event and return a result dict.
+
+    Workers return their outcome instead of appending to shared state, so
+    the driver collects results from the futures with no lock traffic.
+    """
     event_date = event_info["event_date"]
     time_range = event_info["time_range"]
     registration_time = event_info["registration_time"]
     user_tag = event_info["user_tag"]
 
-    def _record_result(result):
-        if results is not None:
-            if results_lock:
-                with results_lock:
-                    results.append(result)
-            else:
-                results.append(result)
-
     logger.info(
-        f"Registering event for user '{user_tag}': {event_date} {time_range} at {registration_time}"
+        "Registering event for user '%s': %s %s at %s",
+        user_tag,
+        event_date,
+        time_range,
+        registration_time,
     )
 
     website = None
     try:
-        website = Website(headless=headless)
+        website = Website(headless=headless, user_tag=user_tag)
         website.login(user_tag=user_tag)
         event_url = website.get_event_url(event_date, time_range)
 
+        if barrier is not None:
+            # Line up with the other workers so every browser starts its
+            # final dwell from the same instant instead of staggering on
+            # login/URL-fetch jitter. A hung peer breaks the barrier at
+            # the timeout and the rest proceed; the per-user delay below
+            # keeps the actual clicks after registration_time either way.
+            timeout = max(0.0, (registration_time - datetime.now()).total_seconds())
+            try:
+                barrier.wait(timeout=timeout)
+            except threading.BrokenBarrierError:
+                logger.warning(
+                    "Registration barrier broken; continuing for user '%s'", user_tag
+                )
+
         delay = random.uniform(MIN_DELAY, MAX_DELAY)
         logger.info(
-            f"Waiting until registration time for user '{user_tag}' (delay: {delay:.2f}s)"
+            "Waiting until registration time for user '%s' (delay: %.2fs)",
+            user_tag,
+            delay,
         )
         dwell_until(registration_time, offset_seconds=-delay)
 
         logger.info(
-            f"Registering for event (user '{user_tag}'): {event_date} {time_range}"
+            "Registering for event (user '%s'): %s %s", user_tag, event_date, time_range
         )
         website.register_for_event(
             event_date=event_date, time_range=time_range, event_url=event_url
         )
 
         logger.info(
-            f"Successfully registered user '{user_tag}' for {event_date} {time_range}"
-        )
-        _record_result(
-            {
-                "user_tag": user_tag,
-                "event": f"{event_date} {time_range}",
-                "success": True,
-            }
+            "Successfully registered user '%s' for %s %s",
+            user_tag,
+            event_date,
+            time_range,
         )
+        return {
+            "user_tag": user_tag,
+            "event": f"{event_date} {time_range}",
+            "success": True,
+        }
     except Exception as e:
         logger.error(
             f"Error registering user '{user_tag}' for {event_date} {time_range}: {e}",
             exc_info=True,
         )
         tb = traceback.format_exc()
-        _record_result(
-            {
-                "user_tag": user_tag,
-                "event": f"{event_date} {time_range}",
-                "success": False,
-                "error": str(e),
-                "traceback": tb,
-                "registration_time": registration_time,
-            }
-        )
+        return {
+            "user_tag": user_tag,
+            "event": f"{event_date} {time_range}",
+            "success": False,
+            "error": str(e),
+            "traceback": tb,
+            "registration_time": registration_time,
+        }
     finally:
         if website is not None:
             try:
-                logger.info(f"Closing website for user '{user_tag}'")
+                logger.info("Closing website for user '%s'", user_tag)
                 website.close()
             except Exception as close_error:
                 logger.warning(
-                    f"Failed to close website for user '{user_tag}': {close_error}"
+                    "Failed to close website for user '%s': %s", user_tag, close_error
                 )
 
 
+def _warm_site_connections(next_events):
+    """Pre-resolves DNS and completes a TLS handshake to each user's site.
+
+    Runs during the HOLD_BUFFER -> LOGIN_BUFFER idle window so the real
+    logins find the resolver cache and the server's TLS session cache
+    warm, instead of paying those round trips at the moment timing
+    matters. Best-effort: any failure is logged and ignored.
+    """
+    hosts = set()
+    for event in next_events:
+        user_tag = event["user_tag"]
+        try:
+            website_file = get_website_token_file(user_tag)
+            with open(website_file, "r") as file:
+                login_url = json.load(file)["login_url"]
+            parsed = urlparse(login_url)
+            port = parsed.port or (443 if parsed.scheme == "https" else 80)
+            hosts.add((parsed.hostname, port, parsed.scheme == "https"))
+        except Exception as e:
+            logger.debug(f"Skipping connection warmup for user '{user_tag}': {e}")
+
+    context = ssl.create_default_context()
+    for host, port, use_tls in hosts:
+        try:
+            socket.getaddrinfo(host, port)  # populate the resolver cache
+            with socket.create_connection((host, port), timeout=10) as sock:
+                if use_tls:
+                    with context.wrap_socket(sock, server_hostname=host):
+                        pass
+            logger.info(f"Warmed connection to {host}:{port}")
+        except OSError as e:
+            logger.debug(f"Connection warmup to {host}:{port} failed: {e}")
+
+
 def register_for_next_event(headless=True):
     logger.info("Starting registration process for the next event(s).")
-    # Connect to the database
-    events = Events()
+    # Connect to the database; the finally guarantees it is released on
+    # every exit path, including exceptions mid-registration.
+    events = get_events()
+    try:
+        _register_for_next_event(events, headless)
+    finally:
+        events.close()
+
+
+def _register_for_next_event(events, headless):
     next_events = events.get_next_event_after()
 
     if not next_events:
         logger.info("No upcoming events.")
-        events.close()
         return
 
     # All events share the same registration time
@@ -156,7 +224,10 @@ def register_for_next_event(headless=True):
 
     for event in next_events:
         logger.info(
-            f"  - User '{event['user_tag']}': {event['event_date']} {event['time_range']}"
+            "  - User '%s': %s %s",
+            event["user_tag"],
+            event["event_date"],
+            event["time_range"],
         )
 
     if is_within_offset(registration_time, offset_minutes=HOLD_BUFFER):
@@ -164,31 +235,41 @@ def register_for_next_event(headless=True):
         dwell_until(registration_time, offset_minutes=HOLD_BUFFER)
     else:
         logger.info("Registration time is too far away.")
-        events.close()
         return
 
+    # Use the idle window before the login dwell ends to warm DNS and TLS
+    # toward each user's site; daemon thread, so a hung handshake can
+    # never delay the registration path.
+    threading.Thread(
+        target=_warm_site_connections, args=(next_events,), daemon=True
+    ).start()
+
     logger.info("Logging in to website(s).")
     dwell_until(registration_time, offset_minutes=LOGIN_BUFFER)
 
     # Register events (concurrent if multiple, sequential if single)
-    results = []
-    max_workers = min(len(next_events), 4)
+    # One worker per event: every registration in this volley must be
+    # in-flight at once or the rendezvous barrier below can never fill.
+    max_workers = len(next_events)
     if len(next_events) > 1:
         logger.info(
             f"Submitting {len(next_events)} events to thread pool (max_workers={max_workers})."
         )
-        results_lock = threading.Lock()
+        # Workers rendezvous here once logged in, so all registrations
+        # fire as one synchronized volley.
+        barrier = threading.Barrier(len(next_events))
         with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
             futures = [
-                executor.submit(
-                    register_for_single_event, event, headless, results, results_lock
-                )
+                executor.submit(register_for_single_event, event, headless, barrier)
                 for event in next_events
             ]
-            concurrent.futures.wait(futures)
+            results = [
+                future.result()
+                for future in concurrent.futures.as_completed(futures)
+            ]
     else:
         # Single event, no threading needed
-        register_for_single_event(next_events[0], headless=headless, results=results)
+        results = [register_for_single_event(next_events[0], headless=headless)]
 
     # Report results and notify on failures
     succeeded = [r for r in results if r["success"]]
@@ -199,7 +280,9 @@ def register_for_next_event(headless=True):
         )
     if failed:
         try:
-            notifier = EmailClient()
+            # Shared per-process client: repeat failure batches reuse one
+            # authenticated connection instead of a cold setup each time.
+            notifier = get_email_client()
             for f in failed:
                 logger.error(
                     f"FAILED: user '{f['user_tag']}' for {f['event']}: {f['error']}"
@@ -221,102 +304,357 @@ def register_for_next_event(headless=True):
 
     logger.info("Removing old events from the database.")
     events.remove_old_events(n_days=cleanup_days)
-    events.close()
+
+
+# Characters/prefixes that mean a reply actually uses textile markup and
+# needs the full pipeline; everything else is plain paragraphs.
+_TEXTILE_MARKERS = ("*", "_", "h1.", "h2.", "h3.", "bc.", "bq.", "|")
+
+
+def _render_reply_html(reply):
+    """Renders a reply body to HTML, skipping textile for plain text.
+
+    The confirmation replies are one or two plain paragraphs; running
+    them through the full textile parser is pure overhead. Only fall
+    back to textile when the text contains markup it would interpret.
+    """
+    if any(marker in reply for marker in _TEXTILE_MARKERS):
+        return textile.textile(reply)
+    return (
+        "<p>"
+        + "</p>\n<p>".join(
+            html.escape(paragraph).replace("\n", "<br>")
+            for paragraph in reply.split("\n\n")
+        )
+        + "</p>"
+    )
+
+
+# <thead> fragment and row template per header schema: report batches
+# reuse one prebuilt template instead of re-running tabulate's per-call
+# column-width pass, which browsers ignore for HTML output anyway.
+_HTML_TABLE_CACHE = {}
+
+
+def _html_table(rows, headers):
+    """Renders rows as an HTML table, caching templates per header tuple."""
+    key = tuple(headers)
+    cached = _HTML_TABLE_CACHE.get(key)
+    if cached is None:
+        head_cells = "".join(f"<th>{html.escape(str(h))}</th>" for h in headers)
+        cached = (
+            f"<table>\n<thead>\n<tr>{head_cells}</tr>\n</thead>\n<tbody>\n",
+            "<tr>" + "<td>{}</td>" * len(headers) + "</tr>",
+        )
+        _HTML_TABLE_CACHE[key] = cached
+    opening, row_template = cached
+    body = "\n".join(
+        row_template.format(*(html.escape(str(cell)) for cell in row))
+        for row in rows
+    )
+    return opening + body + "\n</tbody>\n</table>"
+
+
+def _get_or_login_website(websites, user_tag, headless):
+    """Returns a logged-in Website for user_tag, reusing a cached session.
+
+    Login (TLS + auth handshakes) dominates the per-email cost, so each
+    user's session is created and logged in once per batch. A failed
+    login is not cached, so the next email for that user retries with a
+    fresh instance.
+    """
+    website = websites.get(user_tag)
+    if website is None:
+        website = Website(headless=headless, user_tag=user_tag)
+        try:
+            website.login(user_tag=user_tag)
+        except Exception:
+            try:
+                website.close()
+            except Exception as close_error:
+                logger.warning(
+                    f"Failed to close website after login error for user '{user_tag}': {close_error}"
+                )
+            raise
+        websites[user_tag] = website
+    return website
+
+
+def _resolve_add_tasks(add_tasks, websites, headless):
+    """Resolves registration times for queued add tasks on the website.
+
+    A Selenium session handles one request at a time, so tasks are
+    grouped by user_tag: different users run in parallel on a bounded
+    thread pool while each user's own lookups stay serial on that user's
+    session. Returns {task index: outcome}, where an outcome is either a
+    (registration_time, additional_info) tuple or the exception the
+    lookup raised. Database writes and replies stay on the caller's
+    thread.
+    """
+    outcomes = {}
+
+    tasks_by_user = {}
+    for index, task in enumerate(add_tasks):
+        tasks_by_user.setdefault(task["user_tag"], []).append((index, task))
+
+    def _resolve_for_user(user_tag, user_tasks):
+        for index, task in user_tasks:
+            try:
+                website = _get_or_login_website(websites, user_tag, headless)
+                outcomes[index] = website.determine_access_date(
+                    task["event_date"], task["time_range"]
+                )
+            except Exception as e:
+                logger.error(
+                    f"Failed to determine access date for user '{user_tag}' "
+                    f"({task['event_date']} {task['time_range']}): {e}",
+                    exc_info=True,
+                )
+                outcomes[index] = e
+
+    if len(tasks_by_user) > 1:
+        max_workers = min(len(tasks_by_user), 4)
+        logger.info(
+            f"Resolving adds for {len(tasks_by_user)} users in parallel (max_workers={max_workers})."
+        )
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(_resolve_for_user, user_tag, user_tasks)
+                for user_tag, user_tasks in tasks_by_user.items()
+            ]
+            concurrent.futures.wait(futures)
+    else:
+        for user_tag, user_tasks in tasks_by_user.items():
+            _resolve_for_user(user_tag, user_tasks)
+
+    return outcomes
+
+
+def _handle_report_action(batch, email, user_tag, event_date, time_range):
+    """Defers the report until all add/remove actions have been applied."""
+    logger.info(
+        "Deferring report for user '%s' until all other emails are processed.",
+        user_tag,
+    )
+    batch.deferred_reports.append((email, user_tag))
+    return False
+
+
+def _handle_add_action(batch, email, user_tag, event_date, time_range):
+    """Queues the add; it is resolved and answered after classification."""
+    logger.info("Queueing add for user '%s': %s", user_tag, (event_date, time_range))
+    batch.add_tasks.append(
+        {
+            "email": email,
+            "user_tag": user_tag,
+            "event_date": event_date,
+            "time_range": time_range,
+        }
+    )
+    return False
+
+
+def _handle_remove_action(batch, email, user_tag, event_date, time_range):
+    """Removes the event and queues the cancellation reply."""
+    logger.info("Removing event for user '%s': %s", user_tag, (event_date, time_range))
+    batch.events.remove_event(event_date, time_range, user_tag=user_tag)
+    batch.email_client.enqueue_reply(
+        email,
+        "I am not going to register for the event.",
+        subject=f"Event Registration Cancellation: {event_date} {time_range}",
+        user_tag=user_tag,
+    )
+    return True
+
+
+def _handle_unknown_action(batch, email, user_tag, event_date, time_range):
+    """Answers an email whose intent could not be determined."""
+    logger.info("Could not determine the action from the email.")
+    batch.email_client.enqueue_reply(
+        email, "I am not sure what you want me to do.", user_tag=user_tag
+    )
+    ctx = {
+        "user_tag": user_tag,
+        "email_from": email.From,
+        "email_subject": email.subject,
+        "reason": "could not determine action",
+        "email_body": email.body,
+    }
+    # Deferred like the replies: this handler runs while the producer
+    # thread still owns the shared Gmail transport, so the notification
+    # is only sent once the stream has drained.
+    batch.failure_notifications.append(
+        (
+            "Event registration failed",
+            _format_failure_body(ctx, headless_flag=batch.headless),
+            user_tag,
+        )
+    )
+    return True
+
+
+# Handlers return True when the email is finished (ready to mark read and
+# archive) and False when it was deferred to a later phase.
+_ACTION_HANDLERS = {
+    "report": _handle_report_action,
+    "add": _handle_add_action,
+    "remove": _handle_remove_action,
+}
 
 
 def check_for_new_event(headless=True):
     logger.info("Checking for new events via email.")
-    email_client = EmailClient()
-    email_client.authenticate_email()
-    new_emails = email_client.read_new_emails()
+    email_client = get_email_client()
+    # No eager authenticate_email() call: the client authenticates lazily
+    # (cached token first, interactive flow only as a fallback) when the
+    # first API call needs credentials, so a run with no new mail pays
+    # the minimum connection cost.
+
+    # Fetch runs on a producer thread so the Gmail batch round trips for
+    # later chunks overlap with classification work here. The contacts
+    # cache is warmed first because the Gmail service object is not
+    # thread-safe: once the producer starts, it is the only thread
+    # touching the service until the queue drains. The account address
+    # is resolved now for the same reason — it's a lazy getProfile()
+    # call, and first use below would otherwise hit the shared transport
+    # while the producer is still fetching later chunks. The snapshot is
+    # pinned for the whole pass: a TTL lapse during a long fetch would
+    # otherwise refetch contacts mid-stream.
+    contacts = email_client.prefetch_contacts()
+    system_email = email_client.user
+    inbox = queue.Queue(maxsize=16)
+
+    def _fetch_into_queue():
+        try:
+            for msg in email_client.iter_new_emails():
+                inbox.put(msg)
+        except Exception:
+            logger.exception("Email fetch failed; processing what was queued.")
+        finally:
+            inbox.put(None)  # end-of-stream sentinel
 
-    if not new_emails:
+    threading.Thread(target=_fetch_into_queue, daemon=True).start()
+
+    first_email = inbox.get()
+    if first_email is None:
         logger.info("No new emails found.")
         return
 
     websites = {}  # Per-user Website instances keyed by user_tag
-    events = Events()
+    # One directory listing instead of a stat per email when validating tags.
+    known_tags = list_known_user_tags()
+    events = get_events()
     deferred_reports = []  # Store report requests until all other emails are processed
+    add_tasks = []  # Website-bound add actions, resolved in parallel after classification
+    processed_emails = []  # Finished emails, marked read + archived in one batch at the end
+    failure_notifications = []  # (subject, body, user_tag), sent after the stream drains
+    # Shared state the per-action handlers operate on.
+    batch = SimpleNamespace(
+        email_client=email_client,
+        events=events,
+        deferred_reports=deferred_reports,
+        add_tasks=add_tasks,
+        failure_notifications=failure_notifications,
+        headless=headless,
+    )
 
-    for email in new_emails:
-        # LAYER 1: Global authorization - sender must be in Google Contacts
-        # This is a first-pass filter to reject unknown senders before any processing
-        if email_client.is_sender_authorized(email.From):
-            logger.info(f"Authorized sender (in contacts): {email.From}")
-        else:
-            logger.info(f"Unauthorized sender (not in contacts): {email.From}")
-            email_client.mark_email_as_read(email)
-            email_client.archive_email(email)
-
-            continue
-
-        # Extract user tag from the To address (filter by system email to avoid mismatches)
-        try:
-            user_tag = extract_user_tag(email.To, system_email=email_client.user)
-        except ValueError as e:
-            # Missing system_email or other extraction error - treat as security event
-            logger.error(f"Failed to extract user tag: {e}")
-            email_client.mark_email_as_read(email)
-            email_client.archive_email(email)
-            continue
+    # One transaction for all event writes in this pass; commits once
+    # on exit instead of per insert/remove.
+    with events:
+        for email in chain([first_email], iter(inbox.get, None)):
+            # LAYER 1: Global authorization - sender must be in Google Contacts
+            # This is a first-pass filter to reject unknown senders before any processing
+            if email_client.is_sender_authorized(email.From, contacts=contacts):
+                logger.info("Authorized sender (in contacts): %s", email.From)
+            else:
+                logger.info("Unauthorized sender (not in contacts): %s", email.From)
+                processed_emails.append(email)
 
-        logger.info(f"Processing email for user tag: {user_tag}")
+                continue
 
-        # Validate user tag exists and is properly configured
-        try:
-            user_tag = validate_user_tag(user_tag)
-        except (ValueError, FileNotFoundError) as e:
-            logger.warning(f"Invalid user tag '{user_tag}': {e}")
-            # Silent archive to prevent user enumeration via response timing.
-            email_client.mark_email_as_read(email)
-            email_client.archive_email(email)
-            continue
-
-        # LAYER 2: User-specific authorization - sender must be authorized for this user_tag
-        # Even if sender passed global check (is in contacts), they must be explicitly
-        # authorized for the specific user account they're trying to access
-        sender_email = email_client.extract_email_address(email.From)[0]
-        if not is_sender_allowed(sender_email, user_tag):
-            logger.warning(
-                f"SECURITY: Unauthorized access attempt - sender '{sender_email}' "
-                f"tried to access user tag '{user_tag}'"
-            )
-            # Silent failure - do NOT reply to prevent confirmation of valid tags
-            email_client.mark_email_as_read(email)
-            email_client.archive_email(email)
-            continue
+            # Extract user tag from the To address (filter by system email to avoid mismatches)
+            try:
+                user_tag = extract_user_tag(email.To, system_email=system_email)
+            except ValueError as e:
+                # Missing system_email or other extraction error - treat as security event
+                logger.error("Failed to extract user tag: %s", e)
+                processed_emails.append(email)
+                continue
 
-        action, event_details = extract_user_intent(email)
-        event_date, time_range = event_details or (None, None)
+            logger.info("Processing email for user tag: %s", user_tag)
 
-        if action == "report":
-            logger.info(
-                f"Deferring report for user '{user_tag}' until all other emails are processed."
-            )
-            deferred_reports.append((email, user_tag))
-            continue
-
-        elif action == "add":
-            logger.info(f"Adding event for user '{user_tag}': {event_date, time_range}")
-            if user_tag not in websites:
-                websites[user_tag] = Website(headless=headless)
-            website = websites[user_tag]
-            website.login(user_tag=user_tag)
-            registration_time, additional_info = website.determine_access_date(
-                event_date, time_range
-            )
+            # Validate user tag exists and is properly configured
+            try:
+                user_tag = validate_user_tag_fast(user_tag, known_tags)
+            except (ValueError, FileNotFoundError) as e:
+                logger.warning("Invalid user tag '%s': %s", user_tag, e)
+                # Silent archive to prevent user enumeration via response timing.
+                processed_emails.append(email)
+                continue
+
+            # LAYER 2: User-specific authorization - sender must be authorized for this user_tag
+            # Even if sender passed global check (is in contacts), they must be explicitly
+            # authorized for the specific user account they're trying to access
+            sender_email = email_client.extract_email_address(email.From)[0]
+            if not is_sender_allowed(sender_email, user_tag):
+                logger.warning(
+                    "SECURITY: Unauthorized access attempt - sender '%s' "
+                    "tried to access user tag '%s'",
+                    sender_email,
+                    user_tag,
+                )
+                # Silent failure - do NOT reply to prevent confirmation of valid tags
+                processed_emails.append(email)
+                continue
+
+            action, event_details = extract_user_intent(email)
+            event_date, time_range = event_details or (None, None)
+
+            # One dict lookup routes the email to its handler instead of
+            # a chain of string comparisons; anything unrecognized falls
+            # through to the unknown-action handler.
+            handler = _ACTION_HANDLERS.get(action, _handle_unknown_action)
+            finished = handler(batch, email, user_tag, event_date, time_range)
+            if finished:
+                processed_emails.append(email)
+
+        # Resolve the queued adds against the website — in parallel across
+        # users — then apply DB writes and replies serially on this thread
+        # so sqlite only ever sees one thread.
+        outcomes = _resolve_add_tasks(add_tasks, websites, headless)
+        for index, task in enumerate(add_tasks):
+            email = task["email"]
+            user_tag = task["user_tag"]
+            event_date = task["event_date"]
+            time_range = task["time_range"]
+
+            outcome = outcomes[index]
+            if isinstance(outcome, Exception):
+                # Leave the email unread so the next run retries it.
+                logger.error(
+                    "Add failed for user '%s' (%s %s): %s",
+                    user_tag,
+                    event_date,
+                    time_range,
+                    outcome,
+                )
+                continue
 
+            registration_time, additional_info = outcome
             if registration_time is None:
                 logger.info(
-                    f"Could not determine the registration time for {event_date, time_range}."
+                    "Could not determine the registration time for %s.",
+                    (event_date, time_range),
                 )
                 reply = "I could not determine the registration time."
                 if additional_info:
                     reply += f"\n\nI found this info on the page (check if you are in an eligible tier): {additional_info}"
 
-                email_client.reply_to_email(email, reply, user_tag=user_tag)
+                email_client.enqueue_reply(email, reply, user_tag=user_tag)
                 try:
-                    notifier = EmailClient()
+                    # Reuse this pass's client; a fresh EmailClient would
+                    # redo config loading and authentication.
+                    notifier = email_client
                     ctx = {
                         "user_tag": user_tag,
                         "event_date": event_date,
@@ -335,18 +673,21 @@ def check_for_new_event(headless=True):
                     )
             else:
                 logger.debug(
-                    f"Inserting {event_date, time_range} into database at {registration_time} for user '{user_tag}'"
+                    "Inserting %s into database at %s for user '%s'",
+                    (event_date, time_range),
+                    registration_time,
+                    user_tag,
                 )
                 old_events = events.get_events_by_date(
                     registration_time, user_tag=user_tag
                 )
                 if old_events:
                     logger.info(
-                        f"Event already exists for this date and user: {old_events}. Removing old event."
+                        "Event already exists for this date and user: %s. Removing old event.",
+                        old_events,
                     )
-
-                    for old_event in old_events:
-                        events.remove_event(*old_event, user_tag=user_tag)
+                    # One DELETE replaces the per-row remove loop.
+                    events.remove_events_at(registration_time, user_tag=user_tag)
                 events.insert_event(
                     event_date=event_date,
                     time_range=time_range,
@@ -360,9 +701,9 @@ def check_for_new_event(headless=True):
                 if additional_info:
                     reply += f"\n\nAdditional info: {additional_info}"
 
-                reply_html = textile.textile(reply)
+                reply_html = _render_reply_html(reply)
 
-                email_client.reply_to_email(
+                email_client.enqueue_reply(
                     email,
                     reply_plaintext=reply,
                     reply_html=reply_html,
@@ -371,68 +712,68 @@ def check_for_new_event(headless=True):
                 )
 
                 logger.info(
-                    f"Inserted and emailed {event_date} {time_range} into database at {registration_time} for user '{user_tag}' with additional info: {additional_info}"
+                    "Inserted and emailed %s %s into database at %s for user '%s' with additional info: %s",
+                    event_date,
+                    time_range,
+                    registration_time,
+                    user_tag,
+                    additional_info,
                 )
 
-        elif action == "remove":
-            logger.info(
-                f"Removing event for user '{user_tag}': {event_date, time_range}"
-            )
-            events.remove_event(event_date, time_range, user_tag=user_tag)
-            email_client.reply_to_email(
-                email,
-                "I am not going to register for the event.",
-                subject=f"Event Registration Cancellation: {event_date} {time_range}",
-                user_tag=user_tag,
-            )
+            processed_emails.append(email)
 
-        elif action is None:
-            logger.info("Could not determine the action from the email.")
-            email_client.reply_to_email(
-                email, "I am not sure what you want me to do.", user_tag=user_tag
-            )
-            try:
-                notifier = EmailClient()
-                ctx = {
-                    "user_tag": user_tag,
-                    "email_from": email.From,
-                    "email_subject": email.subject,
-                    "reason": "could not determine action",
-                    "email_body": email.body,
-                }
-                notifier.send_notification(
-                    subject="Event registration failed",
-                    body=_format_failure_body(ctx, headless_flag=headless),
-                    user_tag=user_tag,
+    # Process deferred report requests now that all add/remove actions are complete.
+    # Reports run after every write, so within this batch a user's rows are
+    # stable — memoize the query and both tabulate renderings per user in
+    # case several report emails arrived for the same account.
+    report_cache = {}
+    for report_email, report_user_tag in deferred_reports:
+        logger.info("Reporting events for user '%s' (deferred).", report_user_tag)
+        if report_user_tag not in report_cache:
+            event_list = events.list_all_events(user_tag=report_user_tag)
+            # Omit user_tag column (last element) from each row for privacy
+            event_list = [row[:-1] for row in event_list]
+
+            if not event_list:
+                # No rows: skip the table machinery entirely.
+                report_cache[report_user_tag] = (
+                    "No events scheduled.",
+                    "<p>No events scheduled.</p>",
                 )
-            except Exception:
-                logger.exception(
-                    "Failed to send failure notification for unknown action"
+            else:
+                headers = ["event date", "time range", "registration time", "additional info"]
+                report_cache[report_user_tag] = (
+                    tabulate(event_list, headers=headers),
+                    _html_table(event_list, headers),
                 )
+        reply, reply_html = report_cache[report_user_tag]
 
-        email_client.mark_email_as_read(email)
-        email_client.archive_email(email)
-
-    # Process deferred report requests now that all add/remove actions are complete
-    for report_email, report_user_tag in deferred_reports:
-        logger.info(f"Reporting events for user '{report_user_tag}' (deferred).")
-        event_list = events.list_all_events(user_tag=report_user_tag)
-        # Omit user_tag column (last element) from each row for privacy
-        event_list = [row[:-1] for row in event_list]
-
-        headers = ["event date", "time range", "registration time", "additional info"]
-        reply = tabulate(event_list, headers=headers)
-        reply_html = tabulate(event_list, headers=headers, tablefmt="html")
-
-        email_client.reply_to_email(
+        email_client.enqueue_reply(
             report_email,
             reply_plaintext=reply,
             reply_html=reply_html,
             user_tag=report_user_tag,
         )
 
-        email_client.mark_email_as_read(report_email)
-        email_client.archive_email(report_email)
+        processed_emails.append(report_email)
+
+    # Failure notifications deferred by the unknown-action handler: the
+    # producer owned the shared transport while the stream was live, so
+    # their send round trips happen here, after it has drained.
+    for subject, body, notify_user_tag in failure_notifications:
+        try:
+            email_client.send_notification(
+                subject=subject, body=body, user_tag=notify_user_tag
+            )
+        except Exception:
+            logger.exception("Failed to send failure notification for unknown action")
+
+    # One batched HTTP round trip sends every queued reply, and one
+    # batchModify per label change finishes every processed email —
+    # instead of two modify calls per message.
+    email_client.flush_replies()
+    email_client.mark_emails_as_read(processed_emails)
+    email_client.archive_emails(processed_emails)
 
     logger.info("Closing website and database connections.")
     for tag, website in websites.items():
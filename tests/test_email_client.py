@@ -0,0 +1,233 @@
+import base64
+import time
+
+from email_client import EmailClient
+
+
+def _b64(text):
+    return base64.urlsafe_b64encode(text.encode()).decode()
+
+
+class _FakeCall:
+    def __init__(self, fn):
+        self._fn = fn
+
+    def execute(self):
+        return self._fn()
+
+
+class _FakeMessages:
+    def __init__(self, service):
+        self._service = service
+
+    def list(self, **_kwargs):
+        return _FakeCall(lambda: {"messages": self._service.listing})
+
+    def get(self, **kwargs):
+        # Returned request objects are only handed to the batch; the
+        # (id, format) pair selects the canned response there.
+        return kwargs
+
+    def send(self, userId, body):
+        self._service.sent_bodies.append(body)
+        return {"body": body}
+
+    def batchModify(self, userId, body):
+        self._service.modify_calls.append(body)
+        return _FakeCall(lambda: {})
+
+
+class _FakeUsers:
+    def __init__(self, service):
+        self._service = service
+
+    def messages(self):
+        return _FakeMessages(self._service)
+
+
+class _FakeBatch:
+    def __init__(self, service, callback):
+        self._service = service
+        self._callback = callback
+        self._requests = []
+
+    def add(self, request, request_id=None):
+        self._requests.append((request_id, request))
+
+    def execute(self):
+        for request_id, request in self._requests:
+            key = (request_id, request.get("format"))
+            if key in self._service.responses:
+                self._callback(request_id, self._service.responses[key], None)
+            else:
+                self._callback(request_id, None, Exception("boom"))
+
+
+class _FakeGmailService:
+    """Just enough of the Gmail API surface for the list/get/batch flows.
+
+    Canned batch responses are keyed by (message id, requested format);
+    a missing key makes the batch deliver an exception to the callback.
+    """
+
+    def __init__(self, listing=(), responses=None):
+        self.listing = list(listing)
+        self.responses = responses or {}
+        self.modify_calls = []
+        self.sent_bodies = []
+
+    def users(self):
+        return _FakeUsers(self)
+
+    def new_batch_http_request(self, callback):
+        return _FakeBatch(self, callback)
+
+
+def _make_client(service=None, contacts=frozenset()):
+    client = EmailClient.__new__(EmailClient)
+    if service is not None:
+        client.__dict__["gmail_service"] = service
+    client._contacts_cache = contacts
+    client._contacts_cache_ts = time.monotonic()
+    client._reply_queue = []
+    return client
+
+
+def _metadata_msg(msg_id, sender):
+    return {
+        "id": msg_id,
+        "payload": {"headers": [{"name": "From", "value": sender}]},
+    }
+
+
+def _full_msg(msg_id, body_text):
+    return {
+        "id": msg_id,
+        "threadId": f"thread-{msg_id}",
+        "payload": {
+            "headers": [
+                {"name": "From", "value": "Sender <sender@example.com>"},
+                {"name": "To", "value": "robin@example.com"},
+                {"name": "Subject", "value": "Add event"},
+                {"name": "Message-ID", "value": f"<{msg_id}@example.com>"},
+            ],
+            "mimeType": "text/plain",
+            "body": {"data": _b64(body_text)},
+        },
+    }
+
+
+def test_iter_new_emails_survives_a_failed_fetch_in_the_batch():
+    """One bad message get must not kill the rest of its batch."""
+    service = _FakeGmailService(
+        listing=[{"id": "m1"}, {"id": "m2"}],
+        responses={
+            ("m1", "metadata"): _metadata_msg("m1", "sender@example.com"),
+            ("m2", "metadata"): _metadata_msg("m2", "sender@example.com"),
+            ("m1", "full"): _full_msg("m1", "first body"),
+            # No ("m2", "full"): the full fetch for m2 fails.
+        },
+    )
+    client = _make_client(service, contacts=frozenset({"sender@example.com"}))
+
+    emails = list(client.iter_new_emails())
+
+    assert [email.id for email in emails] == ["m1"]
+    assert emails[0].body == "first body"
+    assert emails[0].subject == "Add event"
+    assert service.modify_calls == []
+
+
+def test_filter_archives_unknown_senders_but_not_failed_fetches():
+    service = _FakeGmailService(
+        responses={
+            ("ok-1", "metadata"): _metadata_msg("ok-1", "sender@example.com"),
+            ("spam-1", "metadata"): _metadata_msg("spam-1", "stranger@example.com"),
+            # No ("flaky-1", "metadata"): that fetch errors out.
+        },
+    )
+    client = _make_client(service, contacts=frozenset({"sender@example.com"}))
+    messages = [{"id": "ok-1"}, {"id": "spam-1"}, {"id": "flaky-1"}]
+
+    kept = client._filter_authorized_messages(service, messages)
+
+    assert [m["id"] for m in kept] == ["ok-1"]
+    # The unknown sender is cleaned up; the failed fetch stays unread
+    # so a transient error never archives mail unseen.
+    assert service.modify_calls == [
+        {"ids": ["spam-1"], "removeLabelIds": ["UNREAD", "INBOX"]}
+    ]
+
+
+def test_parse_full_msg_prefers_plain_text_over_html():
+    client = _make_client()
+    msg = {
+        "id": "m1",
+        "threadId": "thread-m1",
+        "payload": {
+            "headers": [
+                {"name": "From", "value": "Sender <sender@example.com>"},
+                {"name": "To", "value": "a@example.com, b@example.com"},
+                {"name": "Subject", "value": "Hello"},
+                {"name": "Message-Id", "value": "<m1@example.com>"},
+            ],
+            "mimeType": "multipart/mixed",
+            "parts": [
+                {
+                    "mimeType": "multipart/alternative",
+                    "parts": [
+                        {"mimeType": "text/html", "body": {"data": _b64("<p>hi</p>")}},
+                        {"mimeType": "text/plain", "body": {"data": _b64("hi")}},
+                    ],
+                },
+            ],
+        },
+    }
+
+    email = client._parse_full_msg(msg)
+
+    assert email.body == "hi"
+    assert email.From == ["sender@example.com"]
+    assert email.To == ["a@example.com", "b@example.com"]
+    assert email.message_id == "<m1@example.com>"
+
+
+def test_parse_full_msg_falls_back_to_html_body():
+    client = _make_client()
+    msg = {
+        "id": "m2",
+        "threadId": "thread-m2",
+        "payload": {
+            "headers": [{"name": "Subject", "value": "HTML only"}],
+            "mimeType": "multipart/alternative",
+            "parts": [
+                {"mimeType": "text/html", "body": {"data": _b64("<p>only html</p>")}},
+            ],
+        },
+    }
+
+    email = client._parse_full_msg(msg)
+
+    assert email.body == "<p>only html</p>"
+
+
+def test_flush_replies_clears_the_queue_even_when_a_send_fails():
+    service = _FakeGmailService(
+        responses={
+            ("r1", None): {"id": "sent-1"},
+            # No ("r2", None): that send errors inside the batch.
+        },
+    )
+    client = _make_client(service)
+    client._reply_queue = [
+        ("r1", {"raw": "msg-1", "threadId": "t1"}),
+        ("r2", {"raw": "msg-2", "threadId": "t2"}),
+    ]
+
+    client.flush_replies()
+
+    assert client._reply_queue == []
+    assert service.sent_bodies == [
+        {"raw": "msg-1", "threadId": "t1"},
+        {"raw": "msg-2", "threadId": "t2"},
+    ]
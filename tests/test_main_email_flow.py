@@ -20,6 +20,12 @@ class FakeEvents:
     def __init__(self):
         self.closed = False
 
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
     def list_all_events(self, user_tag):
         return []
 
@@ -41,10 +47,16 @@ class FakeEmailClient:
     def authenticate_email(self):
         return None
 
+    def prefetch_contacts(self):
+        return None
+
     def read_new_emails(self):
         return self._emails
 
-    def is_sender_authorized(self, _sender):
+    def iter_new_emails(self, raw_email=False):
+        return iter(self._emails)
+
+    def is_sender_authorized(self, _sender, contacts=None):
         return self._sender_authorized
 
     def mark_email_as_read(self, email):
@@ -53,12 +65,24 @@ class FakeEmailClient:
     def archive_email(self, email):
         self.archived_ids.append(email.id)
 
+    def mark_emails_as_read(self, emails):
+        self.marked_read_ids.extend(email.id for email in emails)
+
+    def archive_emails(self, emails):
+        self.archived_ids.extend(email.id for email in emails)
+
     def delete_email(self, email):
         self.deleted_ids.append(email.id)
 
     def reply_to_email(self, email, reply_plaintext, reply_html=None, subject=None, user_tag=None):
         self.replied_ids.append(email.id)
 
+    def enqueue_reply(self, email, reply_plaintext, reply_html=None, subject=None, user_tag=None):
+        self.replied_ids.append(email.id)
+
+    def flush_replies(self):
+        return None
+
     @staticmethod
     def extract_email_address(addresses):
         if isinstance(addresses, list):
@@ -70,10 +94,10 @@ def test_deferred_reports_are_marked_and_archived_per_report_email(monkeypatch):
     emails = [_make_email("report-1"), _make_email("report-2")]
     fake_client = FakeEmailClient(emails=emails, sender_authorized=True)
 
-    monkeypatch.setattr(main, "EmailClient", lambda: fake_client)
-    monkeypatch.setattr(main, "Events", FakeEvents)
+    monkeypatch.setattr(main, "get_email_client", lambda: fake_client)
+    monkeypatch.setattr(main, "get_events", FakeEvents)
     monkeypatch.setattr(main, "extract_user_tag", lambda *_args, **_kwargs: "default")
-    monkeypatch.setattr(main, "validate_user_tag", lambda user_tag: user_tag)
+    monkeypatch.setattr(main, "validate_user_tag_fast", lambda user_tag, _known_tags: user_tag)
     monkeypatch.setattr(main, "is_sender_allowed", lambda *_args, **_kwargs: True)
     monkeypatch.setattr(main, "extract_user_intent", lambda _email: ("report", None))
 
@@ -88,8 +112,8 @@ def test_unauthorized_sender_is_archived_not_deleted(monkeypatch):
     emails = [_make_email("unauth-1", subject="Hello")]
     fake_client = FakeEmailClient(emails=emails, sender_authorized=False)
 
-    monkeypatch.setattr(main, "EmailClient", lambda: fake_client)
-    monkeypatch.setattr(main, "Events", FakeEvents)
+    monkeypatch.setattr(main, "get_email_client", lambda: fake_client)
+    monkeypatch.setattr(main, "get_events", FakeEvents)
 
     main.check_for_new_event(headless=True)
 
@@ -102,8 +126,8 @@ def test_user_tag_extraction_failure_is_archived_not_deleted(monkeypatch):
     emails = [_make_email("bad-tag-1")]
     fake_client = FakeEmailClient(emails=emails, sender_authorized=True)
 
-    monkeypatch.setattr(main, "EmailClient", lambda: fake_client)
-    monkeypatch.setattr(main, "Events", FakeEvents)
+    monkeypatch.setattr(main, "get_email_client", lambda: fake_client)
+    monkeypatch.setattr(main, "get_events", FakeEvents)
     monkeypatch.setattr(main, "extract_user_tag", lambda *_args, **_kwargs: (_ for _ in ()).throw(ValueError("bad tag")))
 
     main.check_for_new_event(headless=True)
@@ -117,12 +141,12 @@ def test_validate_user_tag_failure_is_archived_not_deleted(monkeypatch):
     emails = [_make_email("invalid-user-1")]
     fake_client = FakeEmailClient(emails=emails, sender_authorized=True)
 
-    monkeypatch.setattr(main, "EmailClient", lambda: fake_client)
-    monkeypatch.setattr(main, "Events", FakeEvents)
+    monkeypatch.setattr(main, "get_email_client", lambda: fake_client)
+    monkeypatch.setattr(main, "get_events", FakeEvents)
     monkeypatch.setattr(main, "extract_user_tag", lambda *_args, **_kwargs: "missing-user")
     monkeypatch.setattr(
         main,
-        "validate_user_tag",
+        "validate_user_tag_fast",
         lambda *_args, **_kwargs: (_ for _ in ()).throw(FileNotFoundError("missing")),
     )
 
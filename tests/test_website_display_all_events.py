@@ -19,6 +19,11 @@ class _FakeDriver:
             return [_FakeElement()] if state.get("indicator") else []
         return []
 
+    def execute_script(self, script, *args):
+        if "querySelectorAll" in script:
+            return self.states[self.index].get("date_box_count", 0)
+        return None
+
 
 def _make_site(states, wait_time=None):
     """Builds a Website with a fake driver and a fake _scroll_down that advances
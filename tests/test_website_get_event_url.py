@@ -1,4 +1,4 @@
-from selenium.webdriver.common.by import By
+from selenium.common.exceptions import TimeoutException
 
 import website
 
@@ -19,11 +19,10 @@ class FakeEvent:
         self._element_map = element_map
 
     def resolve_condition(self, condition):
-        by, xpath = condition
-        assert by == By.XPATH
-        if xpath in self._element_map:
-            return self._element_map[xpath]
-        raise TimeoutError(f"Element not found for xpath: {xpath}")
+        _by, selector = condition
+        if selector in self._element_map:
+            return self._element_map[selector]
+        raise TimeoutException(f"Element not found for selector: {selector}")
 
 
 class FakeDriver:
@@ -37,13 +36,16 @@ class FakeDriver:
             result = condition(self)
             if result:
                 return result
-            raise TimeoutError("Condition callable returned falsy value")
+            raise TimeoutException("Condition callable returned falsy value")
 
-        by, xpath = condition
-        assert by == By.XPATH
-        if xpath in self._element_map:
-            return self._element_map[xpath]
-        raise TimeoutError(f"Element not found for xpath: {xpath}")
+        _by, selector = condition
+        if selector in self._element_map:
+            return self._element_map[selector]
+        raise TimeoutException(f"Element not found for selector: {selector}")
+
+    def find_elements(self, _by, selector):
+        element = self._element_map.get(selector)
+        return [element] if element is not None else []
 
     def execute_script(self, script):
         if "window.__interceptedClipboard = null" in script:
@@ -59,7 +61,7 @@ class FakeDriver:
 
 
 class FakeWebDriverWait:
-    def __init__(self, target, _timeout):
+    def __init__(self, target, _timeout, poll_frequency=None):
         self.target = target
 
     def until(self, condition):
@@ -85,7 +87,7 @@ def test_get_event_url_selects_this_event_only_then_copy(monkeypatch):
 
     event = FakeEvent(
         {
-            ".//button[contains(@aria-label, 'Share event')]": share_button,
+            "button[aria-label*='Share event']": share_button,
         }
     )
 
@@ -113,7 +115,7 @@ def test_get_event_url_returns_none_when_copy_link_missing(monkeypatch):
     share_button = FakeElement()
     event = FakeEvent(
         {
-            ".//button[contains(@aria-label, 'Share event')]": share_button,
+            "button[aria-label*='Share event']": share_button,
         }
     )
     driver = FakeDriver({})
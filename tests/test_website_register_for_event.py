@@ -1,5 +1,4 @@
 from selenium.common.exceptions import ElementClickInterceptedException
-from selenium.webdriver.common.by import By
 
 import website
 
@@ -15,17 +14,19 @@ class FakeElement:
             exc, self._raise_on_click = self._raise_on_click, None
             raise exc
 
+    def is_displayed(self):
+        # The card re-renders after a join; the button is gone.
+        return False
+
 
 class FakeEvent:
-    def __init__(self, element_map):
-        self._element_map = element_map
+    def __init__(self, join_button):
+        self.join_button = join_button
 
-    def resolve_condition(self, condition):
-        by, xpath = condition
-        assert by == By.XPATH
-        if xpath in self._element_map:
-            return self._element_map[xpath]
-        raise TimeoutError(f"Element not found for xpath: {xpath}")
+    def find_elements(self, _by, _xpath):
+        # No leave button in these fakes; the confirmation wait falls
+        # through to the join button's is_displayed check.
+        return []
 
 
 class FakeWebDriverWait:
@@ -33,7 +34,7 @@ class FakeWebDriverWait:
         self.target = target
 
     def until(self, condition):
-        return self.target.resolve_condition(condition)
+        return condition(self.target)
 
 
 class FakeDriver:
@@ -52,6 +53,8 @@ class FakeDriver:
             self.js_clicked_elements.append(args[0])
             args[0].click_calls += 1
             return None
+        if "querySelectorAll" in script and "button" in script:
+            return args[0].join_button
         return None
 
 
@@ -69,16 +72,10 @@ def test_register_for_event_falls_back_to_js_click_when_intercepted(monkeypatch)
     join_button = FakeElement(
         raise_on_click=ElementClickInterceptedException("intercepted")
     )
-    event = FakeEvent(
-        {
-            ".//button[contains(translate(text(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'join')]": join_button,
-        }
-    )
+    event = FakeEvent(join_button)
     driver = FakeDriver()
 
     monkeypatch.setattr(website, "WebDriverWait", FakeWebDriverWait)
-    monkeypatch.setattr(website.EC, "element_to_be_clickable", lambda locator: locator)
-    monkeypatch.setattr(website.time, "sleep", lambda *_args, **_kwargs: None)
 
     site = _make_site(driver, event)
 
@@ -91,16 +88,10 @@ def test_register_for_event_falls_back_to_js_click_when_intercepted(monkeypatch)
 
 def test_register_for_event_uses_native_click_when_not_intercepted(monkeypatch):
     join_button = FakeElement()
-    event = FakeEvent(
-        {
-            ".//button[contains(translate(text(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'join')]": join_button,
-        }
-    )
+    event = FakeEvent(join_button)
     driver = FakeDriver()
 
     monkeypatch.setattr(website, "WebDriverWait", FakeWebDriverWait)
-    monkeypatch.setattr(website.EC, "element_to_be_clickable", lambda locator: locator)
-    monkeypatch.setattr(website.time, "sleep", lambda *_args, **_kwargs: None)
 
     site = _make_site(driver, event)
 
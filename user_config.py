@@ -1,8 +1,12 @@
 """User configuration and identification utilities for multi-tenant support."""
 
+import functools
 import os
 import re
+import string
+import time
 from email.utils import parseaddr
+from itertools import chain
 
 import json
 
@@ -10,73 +14,164 @@ from logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Valid user-tag shape, compiled once. \Z (not $) so a trailing newline
+# cannot sneak past the check.
+_USER_TAG_RE = re.compile(r'^[a-zA-Z0-9_-]+\Z')
+
+# Deletion table over the same character class: translating a valid tag
+# leaves an empty string, so "is every character allowed" becomes one
+# tight C loop — cheaper than a regex match for these short strings.
+_TAG_DELETE_TABLE = str.maketrans('', '', string.ascii_letters + string.digits + '_-')
+
+# Token directory prefix, joined once: get_website_token_file runs
+# several times per email and plain concatenation beats os.path.join.
+_TOKEN_DIR = "user_tokens" + os.sep
+
+
+# Directory snapshots of {filename: mtime_ns}, refreshed at most once
+# per TTL: a batch touching many user tags costs one scandir instead of
+# one stat per tag. 5 s of staleness on an edited config is acceptable.
+_TOKEN_SCAN_TTL_S = 5
+_token_scan_cache = {}
+
+
+def _scan_token_dir(directory):
+    """Returns {filename: mtime_ns} for directory, cached for a short TTL."""
+    now = time.monotonic()
+    cached = _token_scan_cache.get(directory)
+    if cached is not None and now - cached[0] < _TOKEN_SCAN_TTL_S:
+        return cached[1]
+
+    try:
+        with os.scandir(directory) as entries:
+            snapshot = {e.name: e.stat().st_mtime_ns for e in entries if e.is_file()}
+    except OSError:
+        snapshot = {}
+    _token_scan_cache[directory] = (now, snapshot)
+    return snapshot
+
 
 def load_user_config(user_tag):
     """Loads the user configuration from the token file.
-    
+
+    Parsed configs are memoized by (path, mtime); the mtime comes from a
+    short-lived scandir snapshot of the token directory, so a run over
+    many users stats the directory once rather than each file.
+
     Args:
         user_tag: The user tag to load configuration for.
-        
+
     Returns:
         dict: The user configuration dictionary.
     """
     token_file = get_website_token_file(user_tag)
-    if not os.path.exists(token_file):
+    snapshot = _scan_token_dir(os.path.dirname(token_file))
+    mtime_ns = snapshot.get(os.path.basename(token_file))
+    if mtime_ns is None:
         return None
+    return _load_user_config_cached(token_file, mtime_ns)
+
+
+@functools.lru_cache(maxsize=64)
+def _load_user_config_cached(token_file, mtime_ns):
+    """Reads and parses a token file; mtime_ns is part of the cache key only."""
     try:
         with open(token_file, "r") as f:
             return json.load(f)
     except Exception as e:
-        logger.error(f"Error loading config for {user_tag}: {e}")
+        logger.error(f"Error loading config from {token_file}: {e}")
+        return None
+
+# Normalized allowed-sender sets per user_tag, validated against the
+# token file's path and mtime so an edited config invalidates its entry
+# without re-reading the file on every email.
+_allowed_senders_cache = {}
+
+
+def _get_allowed_senders(user_tag):
+    """Returns the normalized allowed-sender set for user_tag, or None.
+
+    The set is built from the user's config once and cached. Freshness
+    is keyed off the same directory snapshot load_user_config reads, so
+    the cache key and the cached content always describe the same file
+    version — a fresh stat here could pair a new mtime with a config
+    parsed from the (up to TTL-stale) snapshot and pin the stale
+    sender set until the file changed again.
+    """
+    token_file = get_website_token_file(user_tag)
+    snapshot = _scan_token_dir(os.path.dirname(token_file))
+    mtime = snapshot.get(os.path.basename(token_file))
+
+    if mtime is not None:
+        cached = _allowed_senders_cache.get(user_tag)
+        if cached is not None and cached[0] == (token_file, mtime):
+            return cached[1]
+
+    config = load_user_config(user_tag)
+    if not config:
         return None
 
+    # Authorized senders plus the user's own website login email,
+    # chained straight into the set — no intermediate list copy.
+    website_email = config.get("email")
+    allowed = frozenset(
+        s.lower().strip()
+        for s in chain(
+            config.get("authorized_senders", ()),
+            (website_email,) if website_email else (),
+        )
+    )
+    if mtime is not None:
+        _allowed_senders_cache[user_tag] = ((token_file, mtime), allowed)
+    return allowed
+
+
 def is_sender_allowed(sender_email, user_tag):
     """Checks if the sender is authorized to act on behalf of the user_tag.
-    
+
     Security: Every user (including 'default') must have explicit authorization.
     The sender must either be listed in 'authorized_senders' or match the
     website login email in the user's config.
-    
+
     Args:
         sender_email: The email address of the sender.
         user_tag: The user tag being requested (will be normalized to lowercase).
-        
+
     Returns:
         bool: True if authorized, False otherwise.
     """
     # Normalize user_tag to lowercase for consistent lookups
     user_tag = user_tag.lower() if user_tag else "default"
-    
-    config = load_user_config(user_tag)
-    if not config:
+
+    allowed = _get_allowed_senders(user_tag)
+    if allowed is None:
         logger.warning(f"No config found for user tag '{user_tag}'")
         return False
-        
-    # Build list of authorized senders (make a copy to avoid modifying config)
-    authorized_senders = list(config.get("authorized_senders", []))
-    
-    # Also allow the user's own email (the one used for the website login)
-    website_email = config.get("email")
-    if website_email:
-        authorized_senders.append(website_email)
-    
+
     # If no authorized senders configured, deny by default (fail-closed)
-    if not authorized_senders:
+    if not allowed:
         logger.warning(f"No authorized senders configured for user tag '{user_tag}'")
         return False
-        
-    # Normalize for comparison
-    sender_norm = sender_email.lower().strip()
-    allowed_norm = [s.lower().strip() for s in authorized_senders]
-    
-    if sender_norm in allowed_norm:
+
+    if sender_email.lower().strip() in allowed:
         logger.debug(f"Sender {sender_email} is authorized for user tag '{user_tag}'")
         return True
-        
+
     logger.warning(f"Sender {sender_email} is NOT authorized for user tag '{user_tag}'")
     return False
 
 
+@functools.lru_cache(maxsize=8)
+def _parse_system_email(system_email):
+    """Splits a system address into (base local part, domain), lowercased.
+
+    The system email is constant for a whole run but extract_user_tag is
+    called once per email, so the split is memoized rather than redone.
+    """
+    local, domain = system_email.split('@', 1)
+    return local.split('+')[0].lower(), domain.lower()
+
+
 def extract_user_tag(email_address, system_email=None):
     """Extracts the user tag from an email address (e.g., 'user1' from 'email+user1@gmail.com').
     Returns 'default' if no tag is present.
@@ -97,9 +192,16 @@ def extract_user_tag(email_address, system_email=None):
     """
     if not email_address:
         return "default"
-    
+
+    # Common case first: a single header string. Normalize forms like
+    # "Name <email@domain>" and fall straight through to tag extraction.
+    if isinstance(email_address, str):
+        parsed_single = parseaddr(email_address)[1]
+        if parsed_single:
+            email_address = parsed_single
+
     # email_address is a list — narrow to addresses matching the system's base email
-    if isinstance(email_address, list):
+    elif isinstance(email_address, list):
         if not email_address:
             return "default"
         
@@ -107,22 +209,27 @@ def extract_user_tag(email_address, system_email=None):
         if not system_email or '@' not in system_email:
             logger.error("system_email is required when processing a list of To addresses")
             raise ValueError("system_email must be provided when email_address is a list")
-        
+
         # Filter to addresses belonging to the system.
-        base_local = system_email.split('@')[0].split('+')[0].lower()
-        base_domain = system_email.split('@')[1].lower()
+        base_local, base_domain = _parse_system_email(system_email)
 
-        parsed_addresses = []
+        # Single pass: split each address once into (base, domain, tag),
+        # collecting matches and their plus-tags together.
+        matching = []
+        tags_found = set()
         for addr in email_address:
             parsed = parseaddr(addr)[1].strip().lower()
-            if parsed and '@' in parsed:
-                parsed_addresses.append(parsed)
-
-        matching = [
-            addr for addr in parsed_addresses
-            if addr.split('@')[0].split('+')[0] == base_local
-            and addr.split('@')[1] == base_domain
-        ]
+            at = parsed.find('@')
+            if not parsed or at < 0:
+                continue
+            local, domain = parsed[:at], parsed[at + 1:]
+            plus = local.find('+')
+            base = local[:plus] if plus >= 0 else local
+            if base != base_local or domain != base_domain:
+                continue
+            matching.append(parsed)
+            if plus >= 0:
+                tags_found.add(local[plus + 1:])
 
         if not matching:
             logger.warning(
@@ -130,40 +237,26 @@ def extract_user_tag(email_address, system_email=None):
             )
             raise ValueError("No recipient address matched the provided system_email")
 
-        email_address = matching
-
         # Warn if multiple addresses carry different plus-tags
-        tags_found = set()
-        for addr in email_address:
-            local = addr.split('@')[0] if '@' in addr else addr
-            if '+' in local:
-                tags_found.add(local.split('+', 1)[1])
         if len(tags_found) > 1:
             logger.warning(
                 f"Multiple different plus-tags found in To addresses: {tags_found}. "
                 "Only the first address will be used."
             )
-        email_address = email_address[0]
-    
-    # Normalize single address from headers like "Name <email@domain>".
-    if isinstance(email_address, str):
-        parsed_single = parseaddr(email_address)[1]
-        if parsed_single:
-            email_address = parsed_single
+        email_address = matching[0]
+
+    # Extract the plus tag with two find()s — no intermediate split lists.
+    at = email_address.find('@')
+    local_end = at if at >= 0 else len(email_address)
+    plus = email_address.find('+')
+    if 0 <= plus < local_end:
+        tag = email_address[plus + 1:local_end].lower()  # Normalize to lowercase
+        if not tag or not _USER_TAG_RE.match(tag):
+            logger.warning(f"Invalid user tag format '{tag}' from {email_address}, using 'default'")
+            return "default"
+        logger.info(f"Extracted user tag: {tag} from {email_address}")
+        return tag
 
-    # Extract the plus tag
-    if '+' in email_address:
-        # Split on '@' first to get the local part
-        local_part = email_address.split('@')[0]
-        # Split on '+' to get the tag (only first segment after '+')
-        if '+' in local_part:
-            tag = local_part.split('+', 1)[1].lower()  # Normalize to lowercase
-            if not tag or not re.match(r'^[a-zA-Z0-9_-]+$', tag):
-                logger.warning(f"Invalid user tag format '{tag}' from {email_address}, using 'default'")
-                return "default"
-            logger.info(f"Extracted user tag: {tag} from {email_address}")
-            return tag
-    
     logger.info(f"No user tag found in {email_address}, using 'default'")
     return "default"
 
@@ -182,9 +275,58 @@ def get_website_token_file(user_tag="default"):
     """
     # Normalize and validate to prevent path traversal attacks
     user_tag = user_tag.lower() if user_tag else "default"
-    if not re.match(r'^[a-zA-Z0-9_-]+$', user_tag):
+    if user_tag.translate(_TAG_DELETE_TABLE):
         raise ValueError(f"Invalid user tag format: '{user_tag}'. Only alphanumeric, underscore, and hyphen allowed.")
-    return os.path.join("user_tokens", f"{user_tag}.json")
+    # Safe to concatenate: the character class above rules out separators
+    # and '..' traversal.
+    return _TOKEN_DIR + user_tag + ".json"
+
+
+def list_known_user_tags():
+    """Returns a snapshot of user tags that currently have a token file.
+
+    One directory listing replaces a per-email stat when validating many
+    tags in a row; pair with validate_user_tag_fast.
+
+    Returns:
+        frozenset: Lowercase user tags with a user_tokens/<tag>.json file.
+    """
+    try:
+        entries = os.listdir("user_tokens")
+    except OSError:
+        return frozenset()
+    return frozenset(f[:-5].lower() for f in entries if f.endswith(".json"))
+
+
+def validate_user_tag_fast(user_tag, known_tags):
+    """Validates a user tag against a pre-listed snapshot of token files.
+
+    Filesystem-free variant of validate_user_tag for hot loops: the caller
+    lists user_tokens/ once via list_known_user_tags and passes the
+    snapshot in, so each check is a regex plus a set lookup.
+
+    Args:
+        user_tag: The user tag to validate
+        known_tags: Snapshot from list_known_user_tags
+
+    Returns:
+        str: The validated user tag (normalized to lowercase)
+
+    Raises:
+        ValueError: If the user tag format is invalid
+        FileNotFoundError: If the tag has no token file in the snapshot
+    """
+    user_tag = user_tag.lower() if user_tag else "default"
+
+    if user_tag != "default" and user_tag.translate(_TAG_DELETE_TABLE):
+        raise ValueError(f"Invalid user tag format: '{user_tag}'. Only alphanumeric, underscore, and hyphen allowed.")
+
+    if user_tag not in known_tags:
+        raise FileNotFoundError(
+            f"No token file found for user '{user_tag}': {get_website_token_file(user_tag)}"
+        )
+
+    return user_tag
 
 
 def validate_user_tag(user_tag):
@@ -209,7 +351,7 @@ def validate_user_tag(user_tag):
             raise FileNotFoundError(f"No token file found for user '{user_tag}': {token_file}")
         return user_tag
     
-    if not re.match(r'^[a-zA-Z0-9_-]+$', user_tag):
+    if user_tag.translate(_TAG_DELETE_TABLE):
         raise ValueError(f"Invalid user tag format: '{user_tag}'. Only alphanumeric, underscore, and hyphen allowed.")
     
     token_file = get_website_token_file(user_tag)
@@ -4,6 +4,19 @@ from logging_config import get_logger
 logger = get_logger(__name__)
 logger.setLevel("DEBUG")
 
+# Patterns compiled once at import instead of per email: the Gmail reply
+# delimiter and the event date/time-range matcher.
+_REPLY_DELIMITER_RE = re.compile(r"\nOn .+ wrote:\n")
+_EVENT_DETAILS_RE = re.compile(
+    r'(?P<date>\b([A-Z]{3},)?\s[A-Z]{3,9}\s\d{1,2}\b)\s*(?P<time_range>\d{1,2}:\d{2}(?:[ap]m)?\s-\s\d{1,2}:\d{2}(?:[ap]m)?)'
+)
+
+# Alternations scan the lowered corpus once instead of one full substring
+# pass per keyword. Deliberately unanchored: "stops"/"cancelled" should
+# keep matching like the plain `in` checks they replace.
+_COMMAND_RE = re.compile(r"report|stop|cancel|remove|add|register")
+_REMOVE_RE = re.compile(r"stop|cancel|remove")
+
 
 def _strip_quoted_reply_text(body):
     """Return only the newest user-authored body content from reply threads."""
@@ -11,21 +24,47 @@ def _strip_quoted_reply_text(body):
         return ""
 
     # Common Gmail reply delimiter.
-    newest = re.split(r"\nOn .+ wrote:\n", body, maxsplit=1)[0]
+    newest = _REPLY_DELIMITER_RE.split(body, maxsplit=1)[0]
     # Drop quoted lines that begin with '>'.
     lines = [line for line in newest.splitlines() if not line.lstrip().startswith(">")]
     return "\n".join(lines).strip()
 
+# Parsed intents memoized by Message-ID: when a batch is retried after a
+# mid-loop failure (the __main__ guard swallows exceptions), unprocessed
+# emails come back and would otherwise be re-parsed. Bounded so a
+# long-lived process can't grow it without limit.
+_INTENT_CACHE_MAX = 1024
+_intent_cache = {}
+
+
 def extract_user_intent(email, assumed_action="add"):
     """
     Extracts the user's intent from an email.
 
+    Results are cached per Message-ID, so re-seeing an email (e.g. on a
+    retried batch) skips the parse.
+
     Args:
         email: The email to extract the user's intent from.
 
     Returns:
         A tuple containing the action and the event URL.
     """
+    cache_key = (getattr(email, "message_id", None), assumed_action)
+    if cache_key[0] and cache_key in _intent_cache:
+        logger.debug(f"Using cached intent for {cache_key[0]}")
+        return _intent_cache[cache_key]
+
+    result = _extract_user_intent_uncached(email, assumed_action)
+
+    if cache_key[0]:
+        if len(_intent_cache) >= _INTENT_CACHE_MAX:
+            _intent_cache.clear()
+        _intent_cache[cache_key] = result
+    return result
+
+
+def _extract_user_intent_uncached(email, assumed_action):
     logger.info("Extracting user intent from email.")
     logger.debug(f"Email subject: {email.subject}")
     logger.debug(f"Email body: {email.body}")
@@ -36,17 +75,18 @@ def extract_user_intent(email, assumed_action="add"):
     subject_lower = email.subject.lower().strip()
     body_clean = _strip_quoted_reply_text(email.body)
     corpus = email.subject + "\n" + body_clean
+    # Lowered once; every keyword test below reads this copy.
+    corpus_lower = corpus.lower()
 
     logger.debug(f"Corpus: {corpus}")
 
     # Guard against accidental event extraction from quoted history in reply threads.
     if subject_lower.startswith("re:"):
-        command_terms = ("report", "stop", "cancel", "remove", "add", "register")
-        if not any(term in corpus.lower() for term in command_terms):
+        if not _COMMAND_RE.search(corpus_lower):
             logger.info("Reply email without explicit command ignored.")
             return None, None
 
-    if "report" in corpus.lower():
+    if "report" in corpus_lower:
         logger.info("Detected action: report")
         return "report", None
 
@@ -60,7 +100,7 @@ def extract_user_intent(email, assumed_action="add"):
         logger.info("No event details found in the email.")
         return None, None
     
-    if "stop" in corpus.lower() or "cancel" in corpus.lower() or "remove" in corpus.lower():
+    if _REMOVE_RE.search(corpus_lower):
         action = "remove"
         logger.info("Detected action: remove")
     else:
@@ -78,9 +118,7 @@ def extract_event_details(text):
     Returns:
     A tuple containing the date and the time range if found, otherwise None.
     """
-    # Regex pattern to match the date and time range format
-    pattern = re.compile(r'(?P<date>\b([A-Z]{3},)?\s[A-Z]{3,9}\s\d{1,2}\b)\s*(?P<time_range>\d{1,2}:\d{2}(?:[ap]m)?\s-\s\d{1,2}:\d{2}(?:[ap]m)?)')
-    match = pattern.search(text)
+    match = _EVENT_DETAILS_RE.search(text)
 
     if match:
         date = match.group('date').strip()
@@ -2,17 +2,26 @@ from selenium import webdriver
 from selenium.webdriver.chrome.service import Service as ChromeService
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.action_chains import ActionChains
-from selenium.common.exceptions import TimeoutException, ElementClickInterceptedException
+from selenium.common.exceptions import (
+    TimeoutException,
+    ElementClickInterceptedException,
+    NoSuchElementException,
+    StaleElementReferenceException,
+    WebDriverException,
+)
 from selenium.webdriver.support.wait import WebDriverWait
 import selenium.webdriver.support.expected_conditions as EC
+import calendar
 from enum import Enum
 
 from selenium.webdriver.chrome.options import Options
 
+import atexit
+import functools
 import re
 import os
+import threading
 from datetime import datetime
-import time
 import json
 from urllib.parse import urlparse
 from logging_config import get_logger
@@ -21,11 +30,260 @@ from user_config import get_website_token_file
 logger = get_logger(__name__)
 logger.setLevel("DEBUG")
 
+# Timeout for lookups inside an already-located card: the element is
+# either in the DOM now or something is wrong, so failing in 5 s beats
+# holding the full page-load timeout.
+_SHORT_WAIT_S = 5
+
 DATE_BOX = ".css-5j348m"
 EVENT_BOX = "css-1hm3hnv"
 EXTRA_CONTENT_BOX = ".MuiGrid-root.MuiGrid-container.MuiGrid-wrap-xs-nowrap.css-a2e4ud"
 LOAD_MORE_INDICATOR_XPATH = "//h6[contains(normalize-space(.), 'Scroll down to load more')]"
 
+# "Mmm dd" join-date parsing, compiled/built once: strptime rebuilds
+# locale state on every call and is far slower than a dict lookup.
+_MMM_DD_RE = re.compile(r"\b([A-Z][a-z]{2}) (\d{1,2})\b")
+_MONTHS = {abbr: index for index, abbr in enumerate(calendar.month_abbr) if abbr}
+
+# Pulls everything determine_access_date needs from an event card in one
+# round trip: the 'not joinable' text, whether a Join button is present,
+# any tier text, and the extra-content block. The old code issued a
+# separate XPath lookup per probe, each a full WebDriver call.
+_EXTRACT_CARD_JS = """
+const card = arguments[0];
+const extraSelector = arguments[1];
+const out = {notJoinable: null, hasJoin: false, tiers: [], extra: ""};
+for (const el of card.querySelectorAll("*")) {
+    const text = el.innerText || "";
+    const lower = text.toLowerCase();
+    if (out.notJoinable === null && lower.includes("not joinable")) {
+        out.notJoinable = text;
+    }
+    if (!out.hasJoin && el.tagName === "BUTTON" && lower.includes("join")) {
+        out.hasJoin = true;
+    }
+    if (lower.includes("tier")) {
+        out.tiers.push(text.trim());
+    }
+}
+const extra = card.querySelector(extraSelector);
+if (extra) { out.extra = extra.innerText || ""; }
+return out;
+"""
+
+# Runs the whole legacy "Load more" loop inside the browser: click the
+# button, let a MutationObserver wait for the card list to settle, and
+# repeat until the button disappears. One async script call replaces
+# the two JSON-Wire round trips (count, click) the Python loop made per
+# page of events.
+_LOAD_MORE_LOOP_JS = """
+const done = arguments[arguments.length - 1];
+const settleMs = 500;
+const findButton = () =>
+    Array.from(document.querySelectorAll("button")).find(
+        (b) => b.textContent.trim() === "Load more"
+    );
+const step = () => {
+    const button = findButton();
+    if (!button) { done(true); return; }
+    let timer = null;
+    const observer = new MutationObserver(() => {
+        clearTimeout(timer);
+        timer = setTimeout(finish, settleMs);
+    });
+    function finish() { observer.disconnect(); step(); }
+    observer.observe(document.body, {childList: true, subtree: true});
+    button.click();
+    timer = setTimeout(finish, settleMs);
+};
+step();
+"""
+
+# One scan over every loaded event card, returning each card's two <h6>
+# texts (whitespace-collapsed, like XPath normalize-space). Python keeps
+# the list, so repeat _find_event lookups match against it instead of
+# re-traversing the page per call.
+_COLLECT_CARDS_JS = """
+const cards = document.querySelectorAll(arguments[0]);
+const text = (el) => el ? el.innerText.replace(/\\s+/g, " ").trim() : "";
+return Array.from(cards).map((card) => {
+    const hs = card.querySelectorAll("h6");
+    return [text(hs[0]), text(hs[1])];
+});
+"""
+
+# Fetches the nth card as a real WebElement once a lookup has matched.
+_NTH_CARD_JS = "return document.querySelectorAll(arguments[0])[arguments[1]];"
+
+# Fallback card locator: a linear scan over the cards in-browser,
+# returning the first whose <h6> texts contain both the date and the
+# time range. Replaces the old sibling-then-ancestor XPath walk, which
+# driver-side XPath engines evaluate naively.
+_FIND_CARD_JS = """
+const [selector, eventDate, timeRange] = arguments;
+const norm = (el) => el.innerText.replace(/\\s+/g, " ").trim();
+for (const card of document.querySelectorAll(selector)) {
+    const texts = Array.from(card.querySelectorAll("h6"), norm);
+    if (texts.some((t) => t.includes(eventDate))
+        && texts.some((t) => t.includes(timeRange))) {
+        return card;
+    }
+}
+return null;
+"""
+
+# Finds a card's clickable Join button in one script call. The XPath
+# translate() lookup it replaces lower-cased every button's text node on
+# the driver side for each poll of the wait.
+_FIND_JOIN_BUTTON_JS = """
+const root = arguments[0] || document;
+return Array.from(root.querySelectorAll("button")).find(
+    (b) => b.textContent.toLowerCase().includes("join")
+        && !b.disabled && b.offsetParent !== null
+) || null;
+"""
+
+
+# Root for persistent per-user Chrome profiles: session cookies survive
+# in the profile between runs, so a warm profile usually lands on the
+# events page already logged in and the credential flow is skipped.
+_PROFILE_ROOT = os.path.expanduser(os.path.join("~", ".cache", "event_register"))
+
+# Idle Chrome sessions kept for reuse, keyed by the options that shaped
+# them: a browser launch costs seconds and a couple hundred MB, so
+# multi-user runs amortize it by checking drivers back in on close()
+# instead of quitting. Drivers are recycled after a bounded number of
+# uses to keep a long-lived browser from accumulating state.
+_POOL_MAX_IDLE = 4
+_MAX_USES_PER_DRIVER = 25
+_driver_pool = {}
+_driver_pool_lock = threading.Lock()
+
+
+def _checkout_driver(pool_key):
+    """Returns an idle pooled driver for pool_key, or None to create one."""
+    with _driver_pool_lock:
+        idle = _driver_pool.get(pool_key)
+        if idle:
+            return idle.pop()
+    return None
+
+
+def _checkin_driver(pool_key, driver):
+    """Returns a driver to the pool, or quits it when worn out or surplus.
+
+    Shared (profile-less) drivers get their cookies cleared so the next
+    checkout starts logged out; drivers on a dedicated user profile keep
+    theirs — the persistent session is the point of the profile.
+    """
+    uses = getattr(driver, "_pool_uses", 0) + 1
+    driver._pool_uses = uses
+    if uses >= _MAX_USES_PER_DRIVER:
+        logger.debug("Driver reached its use limit; quitting instead of pooling.")
+        driver.quit()
+        return
+
+    _headless, profile_dir = pool_key
+    if profile_dir is None:
+        try:
+            driver.delete_all_cookies()
+        except WebDriverException:
+            logger.debug("Driver failed cookie reset; quitting instead of pooling.")
+            driver.quit()
+            return
+
+    with _driver_pool_lock:
+        idle = _driver_pool.setdefault(pool_key, [])
+        if len(idle) < _POOL_MAX_IDLE:
+            idle.append(driver)
+            return
+    driver.quit()
+
+
+# Profiles attached to a live Website. Chrome holds an exclusive lock
+# on its user-data-dir, so a second concurrent session for the same
+# user falls back to a profile-less browser instead of crashing on the
+# locked directory.
+_profiles_in_use = set()
+
+
+def _acquire_profile(profile_dir):
+    """Reserves profile_dir for one session; None when absent or taken."""
+    if profile_dir is None:
+        return None
+    with _driver_pool_lock:
+        if profile_dir in _profiles_in_use:
+            return None
+        _profiles_in_use.add(profile_dir)
+    return profile_dir
+
+
+def _release_profile(profile_dir):
+    if profile_dir is None:
+        return
+    with _driver_pool_lock:
+        _profiles_in_use.discard(profile_dir)
+
+
+def _quit_pooled_drivers():
+    with _driver_pool_lock:
+        drivers = [d for idle in _driver_pool.values() for d in idle]
+        _driver_pool.clear()
+    for driver in drivers:
+        try:
+            driver.quit()
+        except WebDriverException as e:
+            logger.warning(f"Error quitting pooled driver at exit: {e}")
+
+
+atexit.register(_quit_pooled_drivers)
+
+
+@functools.lru_cache(maxsize=16)
+def _read_website_token(path, mtime_ns):
+    """Reads and parses a token file; mtime_ns is part of the cache key only."""
+    with open(path, "r") as f:
+        return json.load(f)
+
+
+def load_website_token(path):
+    """Returns the parsed website token file, cached until it changes on disk.
+
+    Login retries and per-user sweeps re-read the same small JSON file;
+    keying the cache on (path, mtime) keeps repeat reads free while an
+    edited file still invalidates its entry.
+    """
+    return _read_website_token(path, os.stat(path).st_mtime_ns)
+
+
+def _xpath_lower(expr="normalize-space(.)"):
+    """XPath 1.0 case-folding via translate(), built in one place.
+
+    XPath 1.0 has no lower-case(); every case-insensitive text match
+    composes this instead of restating the 26-letter mapping inline.
+    """
+    return (
+        f"translate({expr}, 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', "
+        "'abcdefghijklmnopqrstuvwxyz')"
+    )
+
+
+@functools.lru_cache(maxsize=32)
+def _parse_hms(registration_time):
+    """Splits an 'HH:MM:SS' string into ints, once per distinct value.
+
+    The registration time is the same string for every event in a
+    user's batch, so the split is memoized rather than redone per card.
+    """
+    hour, minute, second = map(int, registration_time.split(":"))
+    return hour, minute, second
+
+
+@functools.lru_cache(maxsize=16)
+def _login_domain(login_url):
+    """Lowercased netloc of a login URL, parsed once per distinct URL."""
+    return urlparse(login_url).netloc.lower()
+
 
 class EventLoadingMode(str, Enum):
     SCROLL = "scroll"
@@ -33,26 +291,85 @@ class EventLoadingMode(str, Enum):
 
 
 class Website:
-    def __init__(self, headless=True, wait_time=30, event_loading_mode=EventLoadingMode.SCROLL):
+    def __init__(
+        self,
+        headless=True,
+        wait_time=30,
+        event_loading_mode=EventLoadingMode.SCROLL,
+        user_tag=None,
+    ):
         """ Initializes the web driver for the website interaction.
         Args:
             headless (bool): Whether to run the browser in headless mode.
             wait_time (int): The maximum wait time for elements to load.
             event_loading_mode (EventLoadingMode | str): Strategy for loading all events on the page.
+            user_tag (str | None): When given, the browser uses a persistent
+                per-user profile so the site session survives between runs.
         """
         logger.info("Initializing the web driver.")
 
-        if headless:
+        profile_dir = (
+            os.path.join(_PROFILE_ROOT, user_tag) if headless and user_tag else None
+        )
+        self._profile_dir = _acquire_profile(profile_dir)
+        if profile_dir and self._profile_dir is None:
+            logger.info(
+                f"Profile for '{user_tag}' is in use by another session; "
+                "using a profile-less browser."
+            )
+        self._pool_key = (headless, self._profile_dir)
+        self.driver = _checkout_driver(self._pool_key)
+        if self.driver is not None:
+            logger.info("Reusing a pooled web driver.")
+        elif headless:
             service = ChromeService(executable_path="/usr/bin/chromedriver")
             options = Options()
             options.headless = headless
 
-            self.driver = webdriver.Chrome(service=service, options=options)
+            # Headless sessions never show anyone pixels, so skip the
+            # subsystems that only exist to produce them: GPU init,
+            # image decoding, extensions, background services. Cuts
+            # both launch time and resident memory per browser.
+            for flag in (
+                "--no-sandbox",
+                "--disable-gpu",
+                "--disable-dev-shm-usage",
+                "--disable-extensions",
+                "--disable-background-networking",
+                "--disable-sync",
+                "--metrics-recording-only",
+                "--mute-audio",
+                "--blink-settings=imagesEnabled=false",
+            ):
+                options.add_argument(flag)
+
+            # driver.get otherwise blocks until the full load event,
+            # which includes images and fonts the scripted flow never
+            # looks at; eager returns on DOMContentLoaded and the
+            # explicit waits cover anything still rendering. The prefs
+            # entry backs up the blink-settings flag for image blocking.
+            options.page_load_strategy = "eager"
+            options.add_experimental_option(
+                "prefs", {"profile.managed_default_content_settings.images": 2}
+            )
+
+            if self._profile_dir:
+                os.makedirs(self._profile_dir, exist_ok=True)
+                options.add_argument(f"--user-data-dir={self._profile_dir}")
+
+            try:
+                self.driver = webdriver.Chrome(service=service, options=options)
+            except WebDriverException:
+                _release_profile(self._profile_dir)
+                raise
         else:
             self.driver = webdriver.Chrome()
 
         self.logged_in = False
         self.user_tag = None
+        self._access_date_cache = {}
+        self._events_fully_loaded = False
+        self._event_index = None
         self.event_loading_mode = self._normalize_event_loading_mode(event_loading_mode)
 
         self.wait_time = wait_time
@@ -73,22 +390,32 @@ class Website:
             return EventLoadingMode.SCROLL
 
     def login(self, user_tag=None):
-        """Logs into the website using the provided credentials."""
+        """Logs into the website using the provided credentials.
+
+        A no-op when this session is already logged in as the same
+        user_tag, so repeated calls cost nothing. A driver holds one
+        site session, so switching users requires a new Website.
+        """
+        user_tag = user_tag or "default"
         if self.logged_in:
-            logger.info("Already logged in.")
-            return
+            if self.user_tag == user_tag:
+                logger.info(f"Already logged in as '{user_tag}'; skipping login.")
+                return
+            raise ValueError(
+                f"Session is logged in as '{self.user_tag}'; a new Website "
+                f"instance is needed to log in as '{user_tag}'."
+            )
 
-        self.user_tag = user_tag or "default"
+        self.user_tag = user_tag
         logger.info(f"Logging into the website for user tag: {self.user_tag}")
         
         website_file = get_website_token_file(self.user_tag)
 
-        if not os.path.exists(website_file):
+        try:
+            website_info = load_website_token(website_file)
+        except OSError:
             logger.error(f"Website token file not found: {website_file}")
             raise FileNotFoundError(f"Website token file not found: {website_file}")
-
-        with open(website_file, "r") as file:
-            website_info = json.load(file)
         logger.debug(f"Website information loaded from {website_file}.")
 
         self.default_registration_time = website_info.get(
@@ -96,12 +423,31 @@ class Website:
         )
 
         login_url = website_info["login_url"]
-        self.website_domain = urlparse(login_url).netloc.lower()
+        self.website_domain = _login_domain(login_url)
         logger.debug(f"Website domain parsed: {self.website_domain}")
 
         self.events_url = website_info["events_url"]
 
-        self.driver.get(login_url)
+        if self._profile_dir:
+            # A persistent profile usually still holds a live session:
+            # land straight on the events page and only run the
+            # credential flow if the Join buttons never appear.
+            self._navigate(self.events_url)
+            try:
+                WebDriverWait(self.driver, _SHORT_WAIT_S).until(
+                    lambda d: d.execute_script(_FIND_JOIN_BUTTON_JS, None)
+                )
+                logger.info(
+                    f"Existing session for '{self.user_tag}' still valid; "
+                    "skipping login form."
+                )
+                self.logged_in = True
+                self._access_date_cache.clear()
+                return
+            except TimeoutException:
+                logger.debug("No live session in the profile; logging in.")
+
+        self._navigate(login_url)
         logger.debug(f"Navigated to login URL: {login_url}")
         self.wait.until(EC.element_to_be_clickable((By.NAME, "email"))).send_keys(
             website_info["email"]
@@ -126,10 +472,24 @@ class Website:
 
         logger.info("Successfully logged into the website.")
         self.logged_in = True
+        # New session: anything scraped under an older session is stale.
+        self._access_date_cache.clear()
+
+    def _navigate(self, url):
+        """Navigates the driver, tracking whether the events page is left.
+
+        Any page load other than the events page invalidates the
+        "all events loaded" state that display_all_events relies on.
+        """
+        if url != getattr(self, "events_url", None):
+            self._events_fully_loaded = False
+        self._event_index = None
+        self.driver.get(url)
 
     def _go_to_events_page(self):
         """Navigates to the events page."""
         logger.info(f"Navigating to events page: {self.events_url}")
+        self._event_index = None
         self.driver.get(self.events_url)
         logger.debug(f"Events page loaded: {self.events_url}")
 
@@ -142,6 +502,13 @@ class Website:
         The loading strategy is controlled by self.event_loading_mode.
         """
 
+        # Loading every day is the expensive part; when nothing has
+        # navigated away since the last full load, the page state is
+        # unchanged and the whole pass can be skipped.
+        if getattr(self, "_events_fully_loaded", False):
+            logger.debug("Events already fully loaded this session; skipping reload.")
+            return
+
         # Ensure we are on the events page
         self._go_to_events_page()
 
@@ -154,16 +521,41 @@ class Website:
         else:
             self._display_all_events_by_scrolling()
 
+        self._events_fully_loaded = True
         logger.info("All events displayed.")
 
+    def _count_event_days(self):
+        """Counts loaded day boxes with one JS evaluation.
+
+        find_elements marshals a remote handle for every matched node just
+        to take len() of the list; querySelectorAll().length returns the
+        number in a single round trip.
+        """
+        return self.driver.execute_script(
+            "return document.querySelectorAll(arguments[0]).length;", DATE_BOX
+        )
+
     def _display_all_events_by_button(self):
-        """Loads events by clicking the legacy "Load more" button until it disappears."""
+        """Loads events by clicking the legacy "Load more" button until it disappears.
+
+        The loop runs in-browser via one async script; the stepwise
+        Python loop remains as the fallback if that script fails.
+        """
+        try:
+            self.driver.set_script_timeout(120)
+            self.driver.execute_async_script(_LOAD_MORE_LOOP_JS)
+            return
+        except WebDriverException:
+            logger.warning(
+                "In-browser load-more loop failed; falling back to stepwise clicks."
+            )
 
         num_days_loaded = 0
+        probe_wait = WebDriverWait(
+            self.driver, timeout=min(3, getattr(self, "wait_time", 30))
+        )
 
-        while num_days_loaded < (
-            num_days_loaded := len(self.driver.find_elements(By.CSS_SELECTOR, DATE_BOX))
-        ):
+        while num_days_loaded < (num_days_loaded := self._count_event_days()):
             logger.debug(f"clicking load more {num_days_loaded = }")
 
             try:
@@ -180,6 +572,13 @@ class Website:
             load_more_button.click()
             logger.debug("Clicked load more button.")
 
+            # Give the click a moment to grow the list so the next count
+            # check doesn't race the fetch and end the loop early.
+            try:
+                probe_wait.until(lambda d: self._count_event_days() > num_days_loaded)
+            except TimeoutException:
+                pass
+
     def _scroll_down(self, amount=1200, indicator_element=None):
         """Jumps to the bottom of the page via JS, then dispatches a real
         mouse-wheel scroll event.
@@ -213,7 +612,7 @@ class Website:
         loaded, which would otherwise mask a stall indefinitely.
         """
 
-        previous_event_count = len(self.driver.find_elements(By.CSS_SELECTOR, DATE_BOX))
+        previous_event_count = self._count_event_days()
         stalled_rounds = 0
         max_stalled_rounds = 3
         scroll_probe_timeout = min(3, getattr(self, "wait_time", 30))
@@ -230,9 +629,7 @@ class Website:
             logger.debug(f"Scrolled events page: {previous_event_count = }")
 
             def progressed(driver):
-                count_grew = (
-                    len(driver.find_elements(By.CSS_SELECTOR, DATE_BOX)) > previous_event_count
-                )
+                count_grew = self._count_event_days() > previous_event_count
                 indicator_gone = had_indicator and not indicator_present()
                 return count_grew or indicator_gone
 
@@ -247,7 +644,7 @@ class Website:
                 logger.debug("Load-more indicator disappeared; all events loaded.")
                 break
 
-            current_event_count = len(self.driver.find_elements(By.CSS_SELECTOR, DATE_BOX))
+            current_event_count = self._count_event_days()
 
             if current_event_count <= previous_event_count:
                 stalled_rounds += 1
@@ -267,39 +664,59 @@ class Website:
         Finds an event card based on the provided date and time range.
         This version searches for a card-like element containing both strings.
         """
-        # Find the card that contains both the date and time strings.
-        # Using normalize-space and case-insensitive check for classes.
-        xpath = (
-            f"//*[contains(@class, '{EVENT_BOX}') and "
-            f".//h6[contains(normalize-space(.), '{event_date}')] and "
-            f".//h6[contains(normalize-space(.), '{time_range}')]]"
-        )
-        
-        try:
-            event = self.wait.until(EC.presence_of_element_located((By.XPATH, xpath)))
-            logger.debug(f"Event card found via robust XPath: {event}")
-            return event
-        except Exception:
-            logger.debug("Falling back to sibling-based search for event.")
-            # Fallback to the original sibling-based logic if the above fails
-            date_time_elements = self.wait.until(
-                EC.presence_of_element_located(
-                    (
-                        By.XPATH,
-                        f"//h6[contains(text(), '{event_date}')]/following-sibling::h6[contains(text(), '{time_range}')]",
-                    )
+        # First try the card index: one JS scan per page state, after
+        # which every lookup is a Python substring match plus a single
+        # fetch of the matching card.
+        index = getattr(self, "_event_index", None)
+        if index is None:
+            index = self.driver.execute_script(_COLLECT_CARDS_JS, "." + EVENT_BOX)
+            self._event_index = index
+
+        for card_number, (card_date, card_time) in enumerate(index):
+            if event_date in card_date and time_range in card_time:
+                logger.debug(f"Event card {card_number} matched via card index.")
+                return self.driver.execute_script(
+                    _NTH_CARD_JS, "." + EVENT_BOX, card_number
                 )
+
+        # Fallback: one in-browser scan over the cards (including the
+        # MuiCard-root variant the old ancestor XPath also caught). The
+        # page is already fully loaded, so a miss is definitive.
+        logger.debug("Falling back to in-browser card scan for event.")
+        event = self.driver.execute_script(
+            _FIND_CARD_JS, f".{EVENT_BOX}, .MuiCard-root", event_date, time_range
+        )
+        if event is None:
+            raise NoSuchElementException(
+                f"No event card found for date '{event_date}', time range '{time_range}'."
             )
-            event = date_time_elements.find_element(
-                By.XPATH,
-                f"./ancestor::*[contains(@class, '{EVENT_BOX}') or contains(@class, 'MuiCard-root')]",
-            )
-            return event
+        return event
 
     def determine_access_date(
         self, event_date: str, time_range: str, registration_time: datetime = None
     ):
-        """Determines the access date for the event."""
+        """Determines the access date for the event.
+
+        Results are memoized per (user, event, time) for the lifetime of
+        this login session, so duplicate requests in one batch don't
+        re-scrape the same page. login() clears the cache.
+        """
+        cache_key = (self.user_tag, event_date, time_range, registration_time)
+        if cache_key in self._access_date_cache:
+            logger.info(
+                f"Using cached access date for event: {event_date}, {time_range}"
+            )
+            return self._access_date_cache[cache_key]
+
+        result = self._determine_access_date_uncached(
+            event_date, time_range, registration_time
+        )
+        self._access_date_cache[cache_key] = result
+        return result
+
+    def _determine_access_date_uncached(
+        self, event_date, time_range, registration_time
+    ):
         logger.info(f"Determining access date for event: {event_date}, {time_range}")
 
         if registration_time is None:
@@ -314,66 +731,41 @@ class Website:
             )
             return None, None
 
-        try:
-            # Case-insensitive search using translate
-            # Using . instead of text() to match element content more reliably
-            xpath = ".//*[contains(translate(., 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'not joinable')]"
-            access_date_element = event.find_element(By.XPATH, xpath)
-            logger.debug("Access date element found.")
-            join_date_text = access_date_element.text
-        except Exception as e:
-            # Check if it's already joinable via a 'JOIN' button
-            try:
-                # Same case-insensitive trick for the join button
-                join_button_xpath = ".//button[contains(translate(., 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'join')]"
-                event.find_element(By.XPATH, join_button_xpath)
+        # Single JS pass over the card; the branch order below mirrors
+        # the old probe order (not-joinable text, Join button, tiers).
+        card = self.driver.execute_script(_EXTRACT_CARD_JS, event, EXTRA_CONTENT_BOX)
+        body_content = card["extra"].replace("\n", " - ") if card["extra"] else ""
+
+        join_date_text = card["notJoinable"]
+        if join_date_text is None:
+            if card["hasJoin"]:
                 logger.info("Event is already joinable.")
-                
-                # Try to extract additional info if available
-                body_content = ""
-                try:
-                    extra_content = event.find_element(By.CSS_SELECTOR, EXTRA_CONTENT_BOX)
-                    if extra_content:
-                        body_content = extra_content.text.replace("\n", " - ")
-                except:
-                    pass
                 return datetime.now(), body_content
-            except:
-                # Look for eligible tiers if we can't find registration info or join button
-                try:
-                    tier_xpath = ".//*[contains(translate(., 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'tier')]"
-                    tier_elements = event.find_elements(By.XPATH, tier_xpath)
-                    if tier_elements:
-                        # Get the most descriptive tier-related text (often includes the list of tiers)
-                        tier_info = sorted([el.text.strip() for el in tier_elements if el.text.strip()], key=len, reverse=True)[0]
-                        logger.info(f"Found tier info: {tier_info}")
-                        return None, tier_info
-                except:
-                    pass
-                
-                logger.error("Neither 'not joinable' text, 'JOIN' button, nor tier info found.", exc_info=True)
-                return None, None
-        
+
+            # Look for eligible tiers if we can't find registration info or join button
+            tiers = [t for t in card["tiers"] if t]
+            if tiers:
+                # Get the most descriptive tier-related text (often includes the list of tiers)
+                tier_info = sorted(tiers, key=len, reverse=True)[0]
+                logger.info(f"Found tier info: {tier_info}")
+                return None, tier_info
+
+            logger.error("Neither 'not joinable' text, 'JOIN' button, nor tier info found.")
+            return None, None
+
         logger.info("Access date element text: " + join_date_text)
-        
-        date_pattern = r"\b[A-Z][a-z]{2} \d{1,2}\b"
-        match = re.search(date_pattern, join_date_text)
+
+        match = _MMM_DD_RE.search(join_date_text)
 
         if match:
-            date_str = match.group(0)
-            date = datetime.strptime(date_str, "%b %d")
-            logger.debug(f"Extracted date string: {date_str}")
+            # Same placeholder year strptime("%b %d") would produce; the
+            # real year is chosen below.
+            date = datetime(1900, _MONTHS[match.group(1)], int(match.group(2)))
+            logger.debug(f"Extracted date string: {match.group(0)}")
 
             if registration_time:
-                registration_time = datetime.strptime(
-                    registration_time, "%H:%M:%S"
-                ).time()
-
-                date = date.replace(
-                    hour=registration_time.hour,
-                    minute=registration_time.minute,
-                    second=registration_time.second,
-                )
+                hour, minute, second = _parse_hms(registration_time)
+                date = date.replace(hour=hour, minute=minute, second=second)
                 logger.debug(f"Registration time set: {registration_time}")
 
             now = datetime.now()
@@ -389,19 +781,7 @@ class Website:
             logger.info("No date found in the text.")
             date = None
 
-        try:
-            extra_content = event.find_element(By.CSS_SELECTOR, EXTRA_CONTENT_BOX)
-
-            # Gather the text content of the remaining first element
-            if extra_content:
-                body_content = extra_content.text.replace("\n", " - ")
-                logger.debug(f"Final body content: {body_content}")
-            else:
-                logger.debug("No nested content elements found.")
-                body_content = ""
-        except:
-            body_content = ""
-
+        logger.debug(f"Final body content: {body_content}")
         return date, body_content
 
     def get_event_url(self, event_date: str, time_range: str):
@@ -409,24 +789,34 @@ class Website:
         logger.info(f"Finding share button for event: {event_date}, {time_range}")
 
         def _click_modal_element(xpath_candidates):
-            for xpath in xpath_candidates:
-                try:
-                    element = self.wait.until(
-                        EC.presence_of_element_located((By.XPATH, xpath))
-                    )
-                    try:
-                        WebDriverWait(self.driver, self.wait_time).until(
-                            EC.element_to_be_clickable((By.XPATH, xpath))
-                        )
-                        element.click()
-                    except Exception:
-                        # MUI overlays can block native Selenium clicks; JS click is a safe fallback.
-                        self.driver.execute_script("arguments[0].click();", element)
-                    logger.debug(f"Clicked modal element via XPath: {xpath}")
-                    return True
-                except Exception:
-                    continue
-            return False
+            # The dialog animates in after the preceding click, so wait
+            # (short) until one candidate has rendered; each poll probes
+            # with find_elements, so a miss is an empty list rather than
+            # an exception built and unwound per absent candidate.
+            def find_first(driver):
+                for xpath in xpath_candidates:
+                    elements = driver.find_elements(By.XPATH, xpath)
+                    if elements:
+                        return xpath, elements[0]
+                return False
+
+            try:
+                xpath, element = WebDriverWait(self.driver, _SHORT_WAIT_S).until(
+                    find_first
+                )
+            except TimeoutException:
+                return False
+
+            try:
+                WebDriverWait(self.driver, _SHORT_WAIT_S).until(
+                    EC.element_to_be_clickable((By.XPATH, xpath))
+                )
+                element.click()
+            except WebDriverException:
+                # MUI overlays can block native Selenium clicks; JS click is a safe fallback.
+                self.driver.execute_script("arguments[0].click();", element)
+            logger.debug(f"Clicked modal element via XPath: {xpath}")
+            return True
 
         self.display_all_events()
         event = self._find_event(event_date, time_range)
@@ -438,12 +828,11 @@ class Website:
             return None
 
         try:
-            share_button = WebDriverWait(event, self.wait_time).until(
+            # CSS attribute match: skips XPath parsing and uses the
+            # browser's native selector engine.
+            share_button = WebDriverWait(event, _SHORT_WAIT_S).until(
                 EC.element_to_be_clickable(
-                    (
-                        By.XPATH,
-                        ".//button[contains(@aria-label, 'Share event')]",
-                    )
+                    (By.CSS_SELECTOR, "button[aria-label*='Share event']")
                 )
             )
             logger.debug("Share button found.")
@@ -467,9 +856,9 @@ class Website:
             scope_option_xpaths = [
                 "//span[contains(@class, 'MuiFormControlLabel-label') and normalize-space(.)='This event only']/ancestor::label[1]",
                 "//span[contains(@class, 'MuiFormControlLabel-label') and normalize-space(.)='This event only']",
-                "//button[contains(translate(normalize-space(.), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'this event only')]",
-                "//label[contains(translate(normalize-space(.), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'this event only')]",
-                "//*[contains(@role, 'option') and contains(translate(normalize-space(.), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'this event only')]",
+                f"//button[contains({_xpath_lower()}, 'this event only')]",
+                f"//label[contains({_xpath_lower()}, 'this event only')]",
+                f"//*[contains(@role, 'option') and contains({_xpath_lower()}, 'this event only')]",
             ]
 
             scope_selected = _click_modal_element(scope_option_xpaths)
@@ -480,8 +869,8 @@ class Website:
             # Modal step 2: click "Copy link"
             copy_link_xpaths = [
                 "//button[normalize-space(.)='Copy link']",
-                "//button[contains(translate(normalize-space(.), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'copy link')]",
-                "//*[@role='button' and contains(translate(normalize-space(.), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'copy link')]",
+                f"//button[contains({_xpath_lower()}, 'copy link')]",
+                f"//*[@role='button' and contains({_xpath_lower()}, 'copy link')]",
             ]
 
             copy_clicked = _click_modal_element(copy_link_xpaths)
@@ -490,8 +879,13 @@ class Website:
                 logger.error("Could not find or click 'Copy link' button.")
                 return None
 
-            # Read the intercepted clipboard value from the browser's JS context
-            event_url = WebDriverWait(self.driver, self.wait_time).until(
+            # Read the intercepted clipboard value from the browser's JS
+            # context. clipboard.writeText fires almost immediately after
+            # the click, so poll tightly with a short deadline instead of
+            # the default half-second cadence under the page-load timeout.
+            event_url = WebDriverWait(
+                self.driver, _SHORT_WAIT_S, poll_frequency=0.05
+            ).until(
                 lambda d: d.execute_script("return window.__interceptedClipboard;")
             )
 
@@ -501,7 +895,7 @@ class Website:
                 logger.warning("Failed to intercept event URL from clipboard.")
 
             return event_url
-        except Exception as e:
+        except WebDriverException:
             logger.error("Share button not found or clipboard intercept failed.", exc_info=True)
             return None
     
@@ -509,20 +903,38 @@ class Website:
         """Registers for the event."""
 
         if event_url:
+            # Cheap string check before a full page load: a URL on some
+            # other domain can't be one of ours, so fall back to the
+            # events listing instead of navigating to it.
+            event_domain = _login_domain(event_url)
+            if event_domain != self.website_domain:
+                logger.warning(
+                    f"Event URL domain '{event_domain}' does not match site "
+                    f"domain '{self.website_domain}'; ignoring the URL."
+                )
+                event_url = None
+
+        if event_url:
+            # The URL lands directly on the event's own page, where the
+            # Join button is top-level: no need to load the full events
+            # listing or search for the card.
             logger.info(f"Navigating to event URL: {event_url}")
-            self.driver.get(event_url)
+            self._navigate(event_url)
+            event = None
         else:
             self.display_all_events()
-
-        event = self._find_event(event_date, time_range)
-
-        join_button = WebDriverWait(event, self.wait_time).until(
-            EC.element_to_be_clickable(
-                (
-                    By.XPATH,
-                    ".//button[contains(translate(text(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'join')]",
-                )
-            )
+            event = self._find_event(event_date, time_range)
+
+        def join_button_present(driver):
+            return driver.execute_script(_FIND_JOIN_BUTTON_JS, event)
+
+        # On the event_url path the page was just (eagerly) loaded and
+        # the SPA may still be rendering, so give the button the full
+        # wait; the short wait is only for the in-card lookup, where the
+        # card is already in the DOM.
+        join_wait = _SHORT_WAIT_S if event is not None else self.wait_time
+        join_button = WebDriverWait(self.driver, join_wait).until(
+            join_button_present
         )
 
         logger.debug(f"Join button found for user '{self.user_tag}'.")
@@ -543,13 +955,39 @@ class Website:
 
         logger.info(f"Clicked join button for user '{self.user_tag}'.")
 
-        time.sleep(30)
+        # Wait for the UI to confirm the join instead of sleeping a fixed
+        # 30 s: the card re-renders (join button goes stale/hidden) or a
+        # Leave button appears. Typical confirmation lands in under a
+        # second; the timeout only bounds a slow server.
+        leave_button_xpath = f".//button[contains({_xpath_lower('.')}, 'leave')]"
+
+        def join_confirmed(_driver):
+            try:
+                if event is not None and event.find_elements(
+                    By.XPATH, leave_button_xpath
+                ):
+                    return True
+            except StaleElementReferenceException:
+                return True
+            try:
+                return not join_button.is_displayed()
+            except StaleElementReferenceException:
+                return True
+
+        try:
+            WebDriverWait(self.driver, self.wait_time).until(join_confirmed)
+        except TimeoutException:
+            logger.warning(
+                f"No join confirmation seen within {self.wait_time}s for user "
+                f"'{self.user_tag}'; the click may still have registered."
+            )
         logger.info(f"Successfully registered for the event (user '{self.user_tag}').")
 
     def close(self):
-        """Closes the browser."""
+        """Releases the browser back to the driver pool (or quits it)."""
         logger.info("Closing the web driver.")
-        self.driver.quit()
+        _checkin_driver(self._pool_key, self.driver)
+        _release_profile(self._profile_dir)
 
 
 # Example usage: